@@ -0,0 +1,76 @@
+"""Tests for retry_on_failure."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from tools.errors import (
+    retry_on_failure,
+    APIError,
+    ClientRequestError,
+    NetworkError,
+    ConfigurationError,
+)
+
+
+@patch("tools.errors.time.sleep")
+class TestRetryOnFailure(unittest.TestCase):
+    """Test retry behavior and backoff."""
+
+    def test_returns_on_first_success(self, mock_sleep):
+        """Test a successful call is not retried."""
+        func = Mock(return_value="ok")
+
+        self.assertEqual(retry_on_failure(func), "ok")
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retries_api_errors_then_succeeds(self, mock_sleep):
+        """Test transient API and network errors are retried."""
+        func = Mock(side_effect=[NetworkError("down"), APIError("busy"), "ok"])
+
+        self.assertEqual(retry_on_failure(func, max_retries=3), "ok")
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_raises_last_error_after_max_retries(self, mock_sleep):
+        """Test the last error is raised once retries are exhausted."""
+        func = Mock(side_effect=APIError("busy"))
+
+        with self.assertRaises(APIError):
+            retry_on_failure(func, max_retries=2)
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_non_retryable_errors_fail_fast(self, mock_sleep):
+        """Test errors outside retry_on are raised without retrying."""
+        for error in (ValueError("bad"), ConfigurationError("bad config")):
+            func = Mock(side_effect=error)
+            with self.assertRaises(type(error)):
+                retry_on_failure(func)
+            func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_rejected_requests_fail_fast(self, mock_sleep):
+        """Test 4xx client errors are not retried even though they are API errors."""
+        func = Mock(side_effect=ClientRequestError("404 - not found"))
+
+        with self.assertRaises(ClientRequestError):
+            retry_on_failure(func)
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_backoff_is_jittered(self, mock_sleep):
+        """Test each delay stays within 50-150% of the exponential backoff."""
+        func = Mock(side_effect=APIError("busy"))
+
+        with self.assertRaises(APIError):
+            retry_on_failure(func, max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        for delay, base in zip(delays, [1.0, 2.0, 4.0]):
+            self.assertGreaterEqual(delay, base * 0.5)
+            self.assertLessEqual(delay, base * 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
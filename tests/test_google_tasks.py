@@ -22,7 +22,7 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 
 from backends.google_tasks import GoogleTasksBackend
-from errors import AuthenticationError
+from errors import AuthenticationError, ClientRequestError
 from backends.base import TaskItem
 from google.auth.exceptions import RefreshError
 
@@ -357,6 +357,23 @@ class TestGoogleTasksBackend(unittest.TestCase):
         self.assertEqual(call_args[1]["tasklist"], "list1")
         self.assertEqual(call_args[1]["task"], "task_id")
 
+    @patch.object(GoogleTasksBackend, "service")
+    def test_transient_socket_error_is_retried(self, mock_service):
+        """Test a timed-out request is retried instead of aborting the sync."""
+        import socket
+
+        mock_service.tasklists().list().execute.side_effect = [
+            socket.timeout("timed out"),
+            {"items": [{"id": "list1", "title": "My Tasks"}]},
+        ]
+        self.backend.service = mock_service
+
+        with patch("errors.time.sleep") as mock_sleep:
+            result = self.backend.get_task_lists()
+
+        mock_sleep.assert_called_once()
+        self.assertEqual([l["id"] for l in result], ["list1"])
+
     def test_api_to_task_item_active(self):
         """Test converting Google API task to TaskItem (active task)."""
         api_task = {
@@ -419,6 +436,73 @@ class TestGoogleTasksBackend(unittest.TestCase):
         m.assert_called_once()
 
 
+    def _fake_batch(self, responses):
+        """Return a batch stub that answers each added request from responses."""
+
+        def _new_batch(callback):
+            added = []
+            batch = Mock()
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, *responses[int(request_id)]) for request_id in added
+            ]
+            return batch
+
+        return _new_batch
+
+    def test_create_tasks_uses_batch_request(self):
+        """Test creates share one batch call and keep their order."""
+        tasks = [TaskItem(id="", title=f"Task {i}", status="active") for i in range(3)]
+        responses = [({"id": f"id{i}", "title": f"Task {i}"}, None) for i in range(3)]
+
+        self.backend.service = Mock()
+        self.backend.service.new_batch_http_request.side_effect = self._fake_batch(responses)
+
+        results = self.backend.create_tasks("list1", tasks)
+
+        self.backend.service.new_batch_http_request.assert_called_once()
+        self.assertEqual([r.id for r in results], ["id0", "id1", "id2"])
+
+    def test_batch_retries_throttled_requests_alone(self):
+        """Test a throttled batch entry is retried through update_task."""
+        from googleapiclient.errors import HttpError
+
+        tasks = [TaskItem(id=f"t{i}", title="Task", status="active") for i in range(2)]
+        throttled = HttpError(Mock(status=429), b"rate limited")
+        responses = [(None, throttled), ({"id": "t1", "title": "Task"}, None)]
+        retried = TaskItem(id="t0", title="Task", status="active")
+
+        self.backend.service = Mock()
+        self.backend.service.new_batch_http_request.side_effect = self._fake_batch(responses)
+
+        with patch.object(self.backend, "update_task", return_value=retried) as mock_update:
+            results = self.backend.update_tasks("list1", tasks)
+
+        mock_update.assert_called_once_with("list1", tasks[0])
+        self.assertIs(results[0], retried)
+        self.assertEqual(results[1].id, "t1")
+
+    def test_batch_retries_unauthorized_requests_alone(self):
+        """Test 401 and token refresh failures in a batch go through update_task."""
+        from googleapiclient.errors import HttpError
+
+        tasks = [TaskItem(id=f"t{i}", title="Task", status="active") for i in range(3)]
+        responses = [
+            (None, HttpError(Mock(status=401), b"unauthorized")),
+            (None, RefreshError("invalid_grant")),
+            (None, HttpError(Mock(status=404), b"not found")),
+        ]
+
+        self.backend.service = Mock()
+        self.backend.service.new_batch_http_request.side_effect = self._fake_batch(responses)
+
+        with patch.object(self.backend, "update_task", side_effect=lambda _, t: t) as mock_update:
+            results = self.backend.update_tasks("list1", tasks)
+
+        self.assertEqual([c[0][1] for c in mock_update.call_args_list], tasks[:2])
+        self.assertEqual(results[:2], tasks[:2])
+        self.assertIsInstance(results[2], ClientRequestError)
+
 class TestGoogleTasksIntegration(unittest.TestCase):
     """Integration tests for Google Tasks (requires actual credentials)."""
 
@@ -0,0 +1,102 @@
+"""Tests for SyncLock file-based locking."""
+
+import os
+import threading
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.locking import SyncLock
+
+
+class TestSyncLock(unittest.TestCase):
+    """Test SyncLock acquire/release behavior."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.lock_file = Path(self.tmp_dir.name) / "sync.lock"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_acquire_and_release(self):
+        """Test lock file records the holder and the lock is freed on release."""
+        lock = SyncLock(self.lock_file)
+
+        self.assertTrue(lock.acquire())
+        self.assertTrue(self.lock_file.exists())
+        self.assertIn(f"PID: {os.getpid()}", self.lock_file.read_text())
+
+        lock.release()
+        self.assertFalse(lock.acquired)
+
+        other = SyncLock(self.lock_file)
+        self.assertTrue(other.acquire())
+        other.release()
+
+    def test_second_acquire_fails_while_held(self):
+        """Test a held lock cannot be acquired again without waiting."""
+        first = SyncLock(self.lock_file)
+        second = SyncLock(self.lock_file)
+
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire(timeout=0))
+
+        first.release()
+        self.assertTrue(second.acquire(timeout=0))
+        second.release()
+
+    def test_leftover_lock_file_does_not_block(self):
+        """Test a lock file left by a dead process does not prevent acquiring."""
+        self.lock_file.write_text("PID: 0\n")
+
+        lock = SyncLock(self.lock_file)
+        self.assertTrue(lock.acquire())
+        self.assertIn(f"PID: {os.getpid()}", self.lock_file.read_text())
+        lock.release()
+
+    def test_acquire_waits_for_release(self):
+        """Test acquire with a timeout succeeds once the holder releases."""
+        holder = SyncLock(self.lock_file)
+        self.assertTrue(holder.acquire())
+
+        releaser = threading.Timer(0.2, holder.release)
+        releaser.start()
+        try:
+            waiter = SyncLock(self.lock_file)
+            self.assertTrue(waiter.acquire(timeout=5))
+            waiter.release()
+        finally:
+            releaser.join()
+
+    def test_polling_wait_backs_off(self):
+        """Test polling waits start short and grow to at most one second."""
+        lock = SyncLock(self.lock_file)
+        with patch("tools.locking.INotify", None), patch("tools.locking.time.sleep") as mock_sleep:
+            for attempt in (0, 1, 20):
+                lock._wait_for_release(5, attempt)
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertAlmostEqual(waits[0], 0.05)
+        self.assertAlmostEqual(waits[1], 0.075)
+        self.assertEqual(waits[2], 1.0)
+
+    def test_creates_missing_parent_directory(self):
+        """Test acquire creates the lock file's parent directory if needed."""
+        lock = SyncLock(Path(self.tmp_dir.name) / "nested" / "dir" / "sync.lock")
+
+        self.assertTrue(lock.acquire())
+        self.assertTrue(lock.lock_file.exists())
+        lock.release()
+
+    def test_context_manager(self):
+        """Test SyncLock works as a context manager."""
+        with SyncLock(self.lock_file) as lock:
+            self.assertTrue(lock.acquired)
+            self.assertFalse(SyncLock(self.lock_file).acquire())
+        self.assertFalse(lock.acquired)
+
+
+if __name__ == "__main__":
+    unittest.main()
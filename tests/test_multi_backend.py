@@ -8,6 +8,7 @@ This test file covers:
 """
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
@@ -22,6 +23,7 @@ from backends.microsoft_todo import MicrosoftTodoBackend
 from backends.google_tasks import GoogleTasksBackend
 from config import Config
 from orgplan_parser import OrgplanParser, OrgplanTask
+from errors import APIError
 
 
 class TestBackendFactory(unittest.TestCase):
@@ -364,6 +366,22 @@ class TestConfigurationBackendSupport(unittest.TestCase):
         errors = config.validate()
         self.assertTrue(any("Google Client ID" in e for e in errors))
 
+    def test_config_validation_month_format(self):
+        """Test the month must be exactly YYYY-MM, without trailing newline."""
+        for month, valid in (("2025-01", True), ("2025-01\n", False), ("2025-1", False)):
+            config = Config(
+                backend="microsoft",
+                client_id="client",
+                tenant_id="tenant",
+                client_secret="secret",
+                month=month,
+            )
+
+            errors = config.validate()
+            self.assertEqual(
+                any("Invalid month format" in e for e in errors), not valid, repr(month)
+            )
+
 
 class TestPriorityHandling(unittest.TestCase):
     """Test priority handling across backends."""
@@ -385,5 +403,258 @@ class TestPriorityHandling(unittest.TestCase):
         self.assertIsNone(task.importance)
 
 
+class TestMicrosoftTokenReuse(unittest.TestCase):
+    """Test application-mode token persistence in the Microsoft backend."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _backend(self):
+        return MicrosoftTodoBackend(
+            client_id="client",
+            tenant_id="tenant",
+            client_secret="secret",
+            token_storage_path=Path(self.tmpdir.name),
+            logger=Mock(),
+        )
+
+    @patch("backends.microsoft_todo.msal.ConfidentialClientApplication")
+    def test_application_token_is_reused_across_runs(self, mock_app):
+        """Test a second run uses the stored token instead of the STS."""
+        mock_app.return_value.acquire_token_for_client.return_value = {
+            "access_token": "token-1",
+            "expires_in": 3600,
+        }
+
+        self._backend().authenticate()
+        second = self._backend()
+        second.authenticate()
+
+        self.assertEqual(second.access_token, "token-1")
+        mock_app.return_value.acquire_token_for_client.assert_called_once()
+
+    @patch("backends.microsoft_todo.msal.ConfidentialClientApplication")
+    def test_application_token_near_expiry_is_refreshed(self, mock_app):
+        """Test a stored token inside the expiry margin is not reused."""
+        mock_app.return_value.acquire_token_for_client.side_effect = [
+            {"access_token": "token-1", "expires_in": 60},
+            {"access_token": "token-2", "expires_in": 3600},
+        ]
+
+        self._backend().authenticate()
+        second = self._backend()
+        second.authenticate()
+
+        self.assertEqual(second.access_token, "token-2")
+
+    @patch("backends.microsoft_todo.msal.ConfidentialClientApplication")
+    def test_msal_app_is_built_once_per_backend(self, mock_app):
+        """Test re-authenticating reuses the MSAL application and its cache."""
+        mock_app.return_value.acquire_token_for_client.return_value = {
+            "access_token": "token-1",
+            "expires_in": 3600,
+        }
+
+        backend = self._backend()
+        backend.authenticate()
+        backend.token_storage.clear_tokens()
+        backend.authenticate()
+
+        mock_app.assert_called_once()
+        self.assertEqual(mock_app.call_args[1]["client_credential"], "secret")
+        self.assertIsNone(backend.client_secret)
+        self.assertEqual(mock_app.return_value.acquire_token_for_client.call_count, 2)
+
+    @patch("backends.microsoft_todo.msal.PublicClientApplication")
+    def test_delegated_app_is_built_only_when_refreshing(self, mock_app):
+        """Test a cached delegated token skips MSAL and refreshes share one app."""
+        mock_app.return_value.acquire_token_by_refresh_token.return_value = {
+            "access_token": "token-2",
+            "expires_in": 3600,
+        }
+        backend = MicrosoftTodoBackend(
+            client_id="client",
+            tenant_id="tenant",
+            auth_mode="delegated",
+            token_storage_path=Path(self.tmpdir.name),
+            allow_prompt=False,
+            logger=Mock(),
+        )
+        backend.token_storage.save_tokens("token-1", "refresh", expires_in=3600)
+
+        backend.authenticate()
+        mock_app.assert_not_called()
+
+        for _ in range(2):
+            backend.token_storage.save_tokens("expired", "refresh", expires_in=60)
+            backend.authenticate()
+
+        self.assertEqual(backend.access_token, "token-2")
+        mock_app.assert_called_once()
+
+
+class TestMicrosoftBatching(unittest.TestCase):
+    """Test Graph $batch writes in the Microsoft backend."""
+
+    def setUp(self):
+        self.backend = MicrosoftTodoBackend(
+            client_id="client", tenant_id="tenant", client_secret="secret", logger=Mock()
+        )
+
+    def test_create_tasks_uses_one_batch_request(self):
+        """Test creates are sent in one $batch call and correlated by ID."""
+        tasks = [TaskItem(id="", title=f"Task {i}", status="active") for i in range(3)]
+        responses = [
+            {"id": str(i), "status": 201, "body": {"id": f"new-{i}", "title": f"Task {i}"}}
+            for i in reversed(range(3))
+        ]
+
+        with patch.object(
+            self.backend, "_make_request", return_value={"responses": responses}
+        ) as mock_request:
+            results = self.backend.create_tasks("list1", tasks)
+
+        mock_request.assert_called_once()
+        method, endpoint, body = mock_request.call_args[0]
+        self.assertEqual((method, endpoint), ("POST", "/$batch"))
+        self.assertEqual(len(body["requests"]), 3)
+        self.assertEqual([r.id for r in results], ["new-0", "new-1", "new-2"])
+
+    def test_batches_are_split_at_limit(self):
+        """Test more than BATCH_LIMIT writes are split across calls."""
+        count = MicrosoftTodoBackend.BATCH_LIMIT + 1
+        tasks = [TaskItem(id=f"t{i}", title="Task", status="active") for i in range(count)]
+
+        def fake_request(method, endpoint, data):
+            return {
+                "responses": [
+                    {"id": r["id"], "status": 200, "body": {"id": r["url"].rsplit("/", 1)[1]}}
+                    for r in data["requests"]
+                ]
+            }
+
+        with patch.object(self.backend, "_make_request", side_effect=fake_request) as mock_request:
+            results = self.backend.update_tasks("list1", tasks)
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual([r.id for r in results], [t.id for t in tasks])
+
+    def test_failed_operations_are_reported_per_task(self):
+        """Test throttled writes are retried alone and client errors are returned."""
+        tasks = [TaskItem(id=f"t{i}", title="Task", status="active") for i in range(2)]
+        responses = [
+            {"id": "0", "status": 429, "body": {}},
+            {"id": "1", "status": 404, "body": {"error": "missing"}},
+        ]
+        retried = TaskItem(id="t0", title="Task", status="active")
+
+        with patch.object(self.backend, "_make_request", return_value={"responses": responses}):
+            with patch.object(self.backend, "update_task", return_value=retried) as mock_update:
+                results = self.backend.update_tasks("list1", tasks)
+
+        mock_update.assert_called_once_with("list1", tasks[0])
+        self.assertIs(results[0], retried)
+        self.assertIsInstance(results[1], Exception)
+
+    def test_success_without_task_body_is_reported_per_task(self):
+        """Test a 2xx entry without a task body fails only that operation."""
+        tasks = [TaskItem(id="", title=f"Task {i}", status="active") for i in range(2)]
+        responses = [
+            {"id": "0", "status": 201, "body": {}},
+            {"id": "1", "status": 201, "body": {"id": "new1", "title": "Task 1"}},
+        ]
+
+        with patch.object(self.backend, "_make_request", return_value={"responses": responses}):
+            with patch.object(self.backend, "create_task") as mock_create:
+                results = self.backend.create_tasks("list1", tasks)
+
+        mock_create.assert_not_called()
+        self.assertIsInstance(results[0], APIError)
+        self.assertEqual(results[1].id, "new1")
+
+    def test_throttled_batch_waits_for_retry_after(self):
+        """Test a 429 inside a batch waits for Retry-After before retrying."""
+        task = TaskItem(id="t0", title="Task", status="active")
+        responses = [{"id": "0", "status": 429, "headers": {"Retry-After": "3"}, "body": {}}]
+
+        with patch.object(self.backend, "_make_request", return_value={"responses": responses}):
+            with patch.object(self.backend, "update_task", return_value=task):
+                with patch("backends.microsoft_todo.time.sleep") as mock_sleep:
+                    results = self.backend.update_tasks("list1", [task])
+
+        mock_sleep.assert_called_once_with(3.0)
+        self.assertIs(results[0], task)
+
+
+class TestMicrosoftTaskListing(unittest.TestCase):
+    """Test task list reads in the Microsoft backend."""
+
+    def setUp(self):
+        self.backend = MicrosoftTodoBackend(
+            client_id="client", tenant_id="tenant", client_secret="secret", logger=Mock()
+        )
+
+    def test_get_tasks_follows_next_link(self):
+        """Test every page is fetched and only the needed fields are selected."""
+        next_link = f"{MicrosoftTodoBackend.GRAPH_API_ENDPOINT}/me/todo/lists/list1/tasks?$skip=100"
+        pages = [
+            {"value": [{"id": "a", "title": "A"}], "@odata.nextLink": next_link},
+            {"value": [{"id": "b", "title": "B", "body": None, "dueDateTime": None}]},
+        ]
+
+        with patch.object(self.backend, "_make_request", side_effect=pages) as mock_request:
+            tasks = self.backend.get_tasks("list1")
+
+        self.assertEqual([t.id for t in tasks], ["a", "b"])
+        first_endpoint = mock_request.call_args_list[0][0][1]
+        self.assertIn("$select=", first_endpoint)
+        self.assertEqual(
+            mock_request.call_args_list[1][0], ("GET", "/me/todo/lists/list1/tasks?$skip=100")
+        )
+
+    def test_next_link_outside_graph_endpoint_is_rejected(self):
+        """Test a nextLink on another host or version raises instead of misrouting."""
+        page = {
+            "value": [{"id": "a", "title": "A"}],
+            "@odata.nextLink": "https://graph.microsoft.com/beta/me/todo/lists/list1/tasks",
+        }
+
+        with patch.object(self.backend, "_make_request", return_value=page):
+            with self.assertRaises(APIError):
+                self.backend.get_tasks("list1")
+
+    def test_task_lists_follow_next_link(self):
+        """Test lists past the first page can be found by name."""
+        next_link = f"{MicrosoftTodoBackend.GRAPH_API_ENDPOINT}/me/todo/lists?$skiptoken=x"
+        pages = [
+            {"value": [{"id": "1", "displayName": "Tasks"}], "@odata.nextLink": next_link},
+            {"value": [{"id": "2", "displayName": "Work"}]},
+        ]
+
+        with patch.object(self.backend, "_make_request", side_effect=pages) as mock_request:
+            self.assertEqual(self.backend.get_list_by_name("Work")["id"], "2")
+
+        self.assertEqual(mock_request.call_args_list[1][0], ("GET", "/me/todo/lists?$skiptoken=x"))
+
+    def test_task_lists_are_fetched_once(self):
+        """Test list lookups after the first one reuse the fetched lists."""
+        lists = {
+            "value": [
+                {"id": "1", "displayName": "Tasks"},
+                {"id": "2", "displayName": "Work"},
+                {"id": "3", "displayName": "Tasks"},
+            ]
+        }
+
+        with patch.object(self.backend, "_make_request", return_value=lists) as mock_request:
+            self.assertEqual(self.backend.get_list_by_name("Tasks")["id"], "1")
+            self.assertEqual(self.backend.get_list_by_name("Work")["id"], "2")
+            self.assertIsNone(self.backend.get_list_by_name("Missing"))
+            self.assertEqual(len(self.backend.get_task_lists()), 3)
+
+        mock_request.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 
 import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from tools.orgplan_parser import OrgplanParser
 
@@ -60,3 +61,181 @@ def test_update_task_due_date_adds_marker(tmp_path):
     parser.update_task_due_date(tasks[0], datetime.date(2025, 6, 30), "plain")
 
     assert parser.lines[1].endswith("<2025-06-30>")
+
+
+def test_parse_timestamps_classifies_markers_in_one_pass():
+    parser = OrgplanParser(Path("unused.md"))
+    text = (
+        "<2025-01-05> SCHEDULED: <2025-02-10 Mon> "
+        "DEADLINE: <2025-03-15 Sat 09:30> <2025-04-01>"
+    )
+
+    with patch("tools.orgplan_parser.orgplan_parse_timestamps", None):
+        deadlines, scheduled, timestamps = parser._parse_timestamps(text)
+
+    assert deadlines == [datetime.datetime(2025, 3, 15, 9, 30)]
+    assert scheduled == [datetime.date(2025, 2, 10)]
+    assert timestamps == [datetime.date(2025, 1, 5), datetime.date(2025, 4, 1)]
+
+
+def test_load_reuses_unchanged_file_and_rereads_after_save(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it\n")
+    first = OrgplanParser(path)
+    first.load()
+
+    second = OrgplanParser(path)
+    with patch("builtins.open", side_effect=AssertionError("file re-read")):
+        second.load()
+    assert second.lines == first.lines
+
+    first.update_task_description(first.parse_tasks()[0], "Ship it today")
+    assert second.lines[1] == "- Ship it"
+
+    first.save()
+    third = OrgplanParser(path)
+    third.load()
+    assert third.lines[1] == "- Ship it today"
+
+
+def test_content_tracks_line_mutations(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it\n")
+    parser = OrgplanParser(path)
+    tasks = parser.parse_tasks()
+    assert parser.content == "# TODO List\n- Ship it"
+
+    parser.update_task_status(tasks[0], "DONE")
+    parser.add_task("Write docs")
+
+    assert parser.content == "# TODO List\n- [DONE] Ship it\n- Write docs"
+
+
+def test_save_writes_same_text_with_or_without_cached_content(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it\n")
+    parser = OrgplanParser(path)
+    parser.parse_tasks()
+    parser.add_task("Write docs")
+
+    parser.save()
+    streamed = path.read_text(encoding="utf-8")
+    _ = parser.content
+    parser.save()
+
+    assert streamed == "# TODO List\n- Ship it\n- Write docs\n"
+    assert path.read_text(encoding="utf-8") == streamed
+
+
+def test_save_skips_unedited_file(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it")
+    parser = OrgplanParser(path)
+    parser.parse_tasks()
+
+    with patch("builtins.open") as mock_open:
+        parser.save()
+
+    mock_open.assert_not_called()
+    assert path.read_text(encoding="utf-8") == "# TODO List\n- Ship it"
+
+
+def test_validate_hands_its_parse_to_the_next_parse_tasks(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it\nstray text\n")
+    parser = OrgplanParser(path)
+
+    with patch.object(
+        OrgplanParser, "_parse_task_line", wraps=parser._parse_task_line
+    ) as parse_line:
+        warnings = parser.validate()
+        tasks = parser.parse_tasks()
+        assert parse_line.call_count == 1
+
+        parser.add_task("Write docs")
+        assert len(parser.parse_tasks()) == 2
+
+    assert warnings == [
+        "Line 3: TODO List section should only contain task items (starting with '- ')"
+    ]
+    assert [t.description for t in tasks] == ["Ship it"]
+
+
+def test_parse_tasks_reuses_result_for_unchanged_file(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it #p1\n")
+    first = OrgplanParser(path).parse_tasks()
+
+    second_parser = OrgplanParser(path)
+    with patch.object(OrgplanParser, "_parse_task_line") as parse_line:
+        second = second_parser.parse_tasks()
+    parse_line.assert_not_called()
+
+    assert second == first
+    second[0].priority = 2
+    assert first[0].priority == 1
+    assert OrgplanParser(path).parse_tasks()[0].priority == 1
+
+
+def test_detail_line_number_tracks_section_header(tmp_path):
+    content = "# TODO List\n- Ship it\n\n# Ship it\nnotes\n"
+    path = _write_tmp(tmp_path, content)
+    parser = OrgplanParser(path)
+    task = parser.parse_tasks()[0]
+    assert task.detail_line_number == 4
+
+    # Inserting a task moves the header; the lookup falls back to a search
+    parser.add_task("Write docs")
+    parser.add_detail_section(task, ms_todo_id="abc")
+
+    assert task.detail_line_number == 5
+    assert parser.lines[4:7] == ["# Ship it", "<!-- ms-todo-id: abc -->", "notes"]
+
+
+def test_header_lookup_follows_headers_added_by_edits(tmp_path):
+    path = _write_tmp(tmp_path, "# TODO List\n- Ship it\n- Notes\n")
+    parser = OrgplanParser(path)
+    ship, notes = parser.parse_tasks()
+
+    parser.add_detail_section(ship, ms_todo_id="a")
+    parser.update_detail_section_body(ship, "details\n# Notes")
+    notes.detail_line_number = 0
+    parser.add_detail_section(notes, ms_todo_id="b")
+
+    assert parser.lines.count("# Notes") == 1
+    assert parser.lines[-2:] == ["# Notes", "<!-- ms-todo-id: b -->"]
+
+
+def test_add_detail_sections_matches_one_by_one(tmp_path):
+    content = "# TODO List\n- A\n- B\n- C\n\n# A\nnotes a\n\n# C\nnotes c\n"
+    bulk = OrgplanParser(_write_tmp(tmp_path, content))
+    tasks = bulk.parse_tasks()
+
+    errors = bulk.add_detail_sections(
+        [(task, {"ms_todo_id": f"id-{task.description}"}) for task in tasks]
+    )
+
+    single_path = tmp_path / "single.md"
+    single_path.write_text(content, encoding="utf-8")
+    single = OrgplanParser(single_path)
+    for task in single.parse_tasks():
+        single.add_detail_section(task, ms_todo_id=f"id-{task.description}")
+
+    assert errors == [None, None, None]
+    assert [t.ms_todo_id for t in tasks] == ["id-A", "id-B", "id-C"]
+    assert bulk.lines == single.lines
+
+
+def test_load_falls_back_to_cp1252(tmp_path):
+    path = tmp_path / "notes.md"
+    path.write_bytes("# TODO List\r\n- Café menu\r\n".encode("cp1252"))
+
+    tasks = OrgplanParser(path).parse_tasks()
+
+    assert [t.description for t in tasks] == ["Café menu"]
+
+
+def test_update_follows_task_line_moved_by_later_insert(tmp_path):
+    path = _write_tmp(tmp_path, "Intro text\n")
+    parser = OrgplanParser(path)
+    first = parser.add_task("First")
+    parser.add_task("Second")  # No TODO List section: inserted above "First"
+
+    parser.update_task_status(first, "DONE")
+
+    assert parser.lines == ["- Second", "- [DONE] First", "Intro text"]
+    assert first.line_number == 2
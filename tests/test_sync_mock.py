@@ -3,10 +3,11 @@
 
 import datetime
 import unittest
+from functools import partial
 from unittest.mock import Mock, MagicMock
 from tools.sync_engine import SyncEngine
-from tools.orgplan_parser import OrgplanTask
-from tools.backends.base import TaskItem
+from tools.orgplan_parser import OrgplanParser, OrgplanTask
+from tools.backends.base import TaskBackend, TaskItem
 
 class TestSyncEngineMock(unittest.TestCase):
     """Test SyncEngine logic without external calls."""
@@ -18,6 +19,12 @@ class TestSyncEngineMock(unittest.TestCase):
         type(self.backend).id_marker_prefix = unittest.mock.PropertyMock(return_value="ms-todo-id")
         type(self.backend).supports_priority = unittest.mock.PropertyMock(return_value=True)
         type(self.backend).backend_name = unittest.mock.PropertyMock(return_value="microsoft")
+        # Batch writes go through the per-task calls, as in the TaskBackend defaults
+        self.backend.create_tasks.side_effect = partial(TaskBackend.create_tasks, self.backend)
+        self.backend.update_tasks.side_effect = partial(TaskBackend.update_tasks, self.backend)
+        self.parser.add_detail_sections.side_effect = partial(
+            OrgplanParser.add_detail_sections, self.parser
+        )
         
         self.engine = SyncEngine(
             orgplan_parser=self.parser,
@@ -135,6 +142,50 @@ class TestSyncEngineMock(unittest.TestCase):
 
         # Verify NO update
         self.backend.update_task.assert_not_called()
+    def test_sync_bidirectional_fetches_backend_tasks_once(self):
+        """Test both task lists are loaded once when Phase 1 changes nothing."""
+        backend_task = TaskItem(id="task-1", title="Same", status="active", importance="normal")
+        task = OrgplanTask(description="Same", status=None, priority=2, line_number=1)
+        setattr(task, "ms_todo_id", "task-1")
+        self.parser.parse_tasks.return_value = [task]
+        self.backend.get_tasks.return_value = [backend_task]
+
+        stats = self.engine.sync_bidirectional()
+
+        self.assertEqual(stats["total_updated"], 0)
+        self.backend.get_tasks.assert_called_once()
+        self.parser.parse_tasks.assert_called_once()
+        self.parser.save.assert_called_once()
+
+    def test_sync_bidirectional_reuses_backend_tasks_after_writes(self):
+        """Test Phase 2 sees Phase 1 creates without refetching the task list."""
+        task = OrgplanTask(description="New Task", status=None, priority=2, line_number=1)
+        self.parser.parse_tasks.return_value = [task]
+        self.backend.get_tasks.return_value = []
+        created = TaskItem(id="new_id", title="New Task", status="active", importance="normal")
+        self.backend.create_task.return_value = created
+
+        stats = self.engine.sync_bidirectional()
+
+        self.assertEqual(stats["total_created"], 1)
+        self.backend.get_tasks.assert_called_once()
+        self.parser.add_task.assert_not_called()
+
+    def test_priority_and_status_mappings(self):
+        """Test the priority/importance and status mappings in both directions."""
+        to_importance = self.engine._map_priority_to_importance
+        self.assertEqual(
+            [to_importance(p) for p in (None, 1, 2, 3, 7)],
+            ["normal", "high", "normal", "low", "low"],
+        )
+        self.assertEqual(self.engine._map_importance_to_priority("low"), 3)
+        self.assertIsNone(self.engine._map_importance_to_priority(None))
+        for status in ("DONE", "DELEGATED", "CANCELED"):
+            self.assertEqual(self.engine._map_orgplan_status_to_todo(status), "completed")
+        self.assertEqual(self.engine._map_orgplan_status_to_todo("PENDING"), "active")
+        self.assertEqual(self.engine._map_todo_status_to_orgplan("completed"), "DONE")
+        self.assertIsNone(self.engine._map_todo_status_to_orgplan("active"))
+
 
 if __name__ == "__main__":
     unittest.main()
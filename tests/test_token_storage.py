@@ -0,0 +1,69 @@
+"""Tests for TokenStorage."""
+
+import unittest
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.token_storage import TokenStorage
+
+
+class TestTokenStorage(unittest.TestCase):
+    """Test token persistence and reuse."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = Path(self.tmp_dir.name) / ".tokens"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_token_file_is_read_once(self):
+        """Test repeated lookups reuse the tokens loaded from disk."""
+        TokenStorage(self.storage_path).save_tokens("access", "refresh", expires_in=3600)
+        storage = TokenStorage(self.storage_path)
+
+        self.assertEqual(storage.get_access_token(), "access")
+        with patch("builtins.open", side_effect=AssertionError("token file re-read")):
+            self.assertEqual(storage.get_refresh_token(), "refresh")
+            self.assertEqual(storage.get_access_token(), "access")
+
+    def test_saved_and_cleared_tokens_are_seen_without_reload(self):
+        """Test save and clear update what later lookups return."""
+        storage = TokenStorage(self.storage_path)
+        storage.save_tokens("access", "refresh", expires_in=3600)
+        self.assertEqual(storage.get_refresh_token(), "refresh")
+
+        storage.clear_tokens()
+
+        self.assertFalse(storage.has_tokens())
+        self.assertIsNone(storage.load_tokens())
+
+    def test_expiry_ignores_wall_clock_changes_after_load(self):
+        """Test a loaded token stays valid if the system clock jumps ahead."""
+        TokenStorage(self.storage_path).save_tokens("access", expires_in=3600)
+        storage = TokenStorage(self.storage_path)
+        self.assertEqual(storage.get_access_token(), "access")
+
+        with patch("tools.token_storage.time.time", return_value=time.time() + 86400):
+            self.assertEqual(storage.get_access_token(), "access")
+
+        with patch(
+            "tools.token_storage.time.monotonic", return_value=time.monotonic() + 3600
+        ):
+            self.assertIsNone(storage.get_access_token())
+
+    def test_save_replaces_token_file_atomically(self):
+        """Test saves leave only a private token file behind."""
+        storage = TokenStorage(self.storage_path)
+        storage.save_tokens("old", "refresh", expires_in=3600)
+        storage.save_tokens("new", "refresh", expires_in=3600)
+
+        self.assertEqual([p.name for p in self.storage_path.iterdir()], ["tokens.json"])
+        self.assertEqual(storage.token_file.stat().st_mode & 0o777, 0o600)
+        self.assertEqual(TokenStorage(self.storage_path).get_access_token(), "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
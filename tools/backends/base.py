@@ -104,6 +104,50 @@ class TaskBackend(ABC):
         """
         pass
 
+    def create_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Create several tasks.
+
+        The default implementation calls create_task once per task. Backends
+        with a batch endpoint override this to save round trips.
+
+        Args:
+            list_id: The ID of the task list
+            tasks: TaskItems to create
+
+        Returns:
+            One entry per task, in order: the created TaskItem, or the
+            exception raised while creating it
+        """
+        results = []
+        for task in tasks:
+            try:
+                results.append(self.create_task(list_id, task))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def update_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Update several tasks.
+
+        The default implementation calls update_task once per task. Backends
+        with a batch endpoint override this to save round trips.
+
+        Args:
+            list_id: The ID of the task list
+            tasks: TaskItems with updated fields
+
+        Returns:
+            One entry per task, in order: the updated TaskItem, or the
+            exception raised while updating it
+        """
+        results = []
+        for task in tasks:
+            try:
+                results.append(self.update_task(list_id, task))
+            except Exception as e:
+                results.append(e)
+        return results
+
     @abstractmethod
     def delete_task(self, list_id: str, task_id: str) -> None:
         """Delete a task.
@@ -114,6 +158,12 @@ class TaskBackend(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release network resources held by the backend.
+
+        The default implementation does nothing.
+        """
+
     @property
     @abstractmethod
     def backend_name(self) -> str:
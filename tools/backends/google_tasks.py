@@ -10,12 +10,23 @@ import os
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from google.auth.exceptions import RefreshError
+from google.auth.exceptions import RefreshError, TransportError
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
 
 from .base import TaskBackend, TaskItem
-from errors import retry_on_failure, APIError, NetworkError, AuthenticationError
+from errors import (
+    retry_on_failure,
+    APIError,
+    ClientRequestError,
+    NetworkError,
+    AuthenticationError,
+)
+
+# Transport failures raised by the Google client (timeouts and connection
+# errors are OSError); they are wrapped as NetworkError so they get retried
+_TRANSPORT_ERRORS = (OSError, HttpLib2Error, TransportError)
 
 
 class GoogleTasksBackend(TaskBackend):
@@ -26,6 +37,8 @@ class GoogleTasksBackend(TaskBackend):
 
     # OAuth 2.0 scopes
     SCOPES = ["https://www.googleapis.com/auth/tasks"]
+    # Requests sent per batch call in create_tasks/update_tasks
+    BATCH_LIMIT = 100
     service = None
 
     def __init__(
@@ -223,14 +236,19 @@ class GoogleTasksBackend(TaskBackend):
             error: HttpError from Google API
 
         Returns:
-            APIError or NetworkError
+            APIError for retryable failures, ClientRequestError for other 4xx
         """
         if error.resp.status >= 500:
             return APIError(f"Server error {error.resp.status}: {error.content}")
         elif error.resp.status == 429:
             return APIError(f"Rate limited: {error.content}")
-        else:
+        elif error.resp.status == 403:
+            # Google also reports per-user rate limits as 403, so these stay retryable
             return APIError(f"API request failed: {error.resp.status} - {error.content}")
+        else:
+            return ClientRequestError(
+                f"API request failed: {error.resp.status} - {error.content}"
+            )
 
     def get_task_lists(self) -> list[dict]:
         """Get all task lists."""
@@ -262,6 +280,8 @@ class GoogleTasksBackend(TaskBackend):
                 return self._execute_with_reauth(_call)
             except HttpError as e:
                 raise self._handle_api_error(e)
+            except _TRANSPORT_ERRORS as e:
+                raise NetworkError(f"Network error: {e}")
 
         return retry_on_failure(_get_lists, max_retries=3, logger=self.logger)
 
@@ -323,6 +343,8 @@ class GoogleTasksBackend(TaskBackend):
                 return self._execute_with_reauth(_call)
             except HttpError as e:
                 raise self._handle_api_error(e)
+            except _TRANSPORT_ERRORS as e:
+                raise NetworkError(f"Network error: {e}")
 
         return retry_on_failure(_get_tasks, max_retries=3, logger=self.logger)
 
@@ -340,17 +362,7 @@ class GoogleTasksBackend(TaskBackend):
         def _create_task():
             try:
                 def _call():
-                    # Build Google Tasks task object
-                    task_body = {
-                        "title": task.title,
-                        "status": "completed" if task.status == "completed" else "needsAction",
-                    }
-
-                    if task.body:
-                        task_body["notes"] = task.body
-                    if task.due_date:
-                        task_body["due"] = self._format_due_date(task.due_date)
-
+                    task_body = self._create_body(task)
                     result = (
                         self.service.tasks().insert(tasklist=list_id, body=task_body).execute()
                     )
@@ -360,6 +372,8 @@ class GoogleTasksBackend(TaskBackend):
                 return self._execute_with_reauth(_call)
             except HttpError as e:
                 raise self._handle_api_error(e)
+            except _TRANSPORT_ERRORS as e:
+                raise NetworkError(f"Network error: {e}")
 
         return retry_on_failure(_create_task, max_retries=3, logger=self.logger)
 
@@ -377,18 +391,7 @@ class GoogleTasksBackend(TaskBackend):
         def _update_task():
             try:
                 def _call():
-                    # Build Google Tasks task object
-                    task_body = {
-                        "id": task.id,
-                        "title": task.title,
-                        "status": "completed" if task.status == "completed" else "needsAction",
-                    }
-
-                    if task.body is not None:
-                        task_body["notes"] = task.body
-                    if task.due_date:
-                        task_body["due"] = self._format_due_date(task.due_date)
-
+                    task_body = self._update_body(task)
                     result = (
                         self.service.tasks()
                         .update(tasklist=list_id, task=task.id, body=task_body)
@@ -400,9 +403,80 @@ class GoogleTasksBackend(TaskBackend):
                 return self._execute_with_reauth(_call)
             except HttpError as e:
                 raise self._handle_api_error(e)
+            except _TRANSPORT_ERRORS as e:
+                raise NetworkError(f"Network error: {e}")
 
         return retry_on_failure(_update_task, max_retries=3, logger=self.logger)
 
+    def create_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Create several tasks using Google API batch requests."""
+        return self._batch(
+            lambda i: self.service.tasks().insert(
+                tasklist=list_id, body=self._create_body(tasks[i])
+            ),
+            lambda i: self.create_task(list_id, tasks[i]),
+            len(tasks),
+        )
+
+    def update_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Update several tasks using Google API batch requests."""
+        return self._batch(
+            lambda i: self.service.tasks().update(
+                tasklist=list_id, task=tasks[i].id, body=self._update_body(tasks[i])
+            ),
+            lambda i: self.update_task(list_id, tasks[i]),
+            len(tasks),
+        )
+
+    def _batch(self, make_request, retry_one, count: int) -> list:
+        """Send task writes as Google API batch requests.
+
+        Up to BATCH_LIMIT requests share one HTTP call. Operations that were
+        throttled, hit a server error, were rejected as unauthorized (401 or a
+        failed token refresh), or never ran because the batch call itself
+        failed are retried one by one through retry_one, which refreshes
+        credentials, re-authenticates on invalid_grant, and backs off.
+
+        Args:
+            make_request: Callable building the API request for an operation index
+            retry_one: Callable taking an operation index and performing it alone
+            count: Number of operations
+
+        Returns:
+            One entry per operation, in order: a TaskItem or the exception raised
+        """
+        results = [None] * count
+
+        def _callback(request_id, response, exception):
+            i = int(request_id)
+            if exception is None:
+                results[i] = self._api_to_task_item(response)
+            elif isinstance(exception, RefreshError):
+                # Left for retry_one, which re-authenticates on invalid_grant
+                pass
+            elif not isinstance(exception, HttpError):
+                results[i] = exception
+            elif exception.resp.status not in (401, 429) and exception.resp.status < 500:
+                results[i] = self._handle_api_error(exception)
+
+        for start in range(0, count, self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_callback)
+            for i in range(start, min(start + self.BATCH_LIMIT, count)):
+                batch.add(make_request(i), request_id=str(i))
+            try:
+                batch.execute()
+            except Exception as e:
+                self.logger.warning(f"Batch request failed, retrying individually: {e}")
+
+        for i, result in enumerate(results):
+            if result is None:
+                try:
+                    results[i] = retry_one(i)
+                except Exception as e:
+                    results[i] = e
+
+        return results
+
     def delete_task(self, list_id: str, task_id: str) -> None:
         """Delete a task.
 
@@ -419,9 +493,40 @@ class GoogleTasksBackend(TaskBackend):
                 return self._execute_with_reauth(_call)
             except HttpError as e:
                 raise self._handle_api_error(e)
+            except _TRANSPORT_ERRORS as e:
+                raise NetworkError(f"Network error: {e}")
 
         retry_on_failure(_delete_task, max_retries=3, logger=self.logger)
 
+    def _create_body(self, task: TaskItem) -> dict:
+        """Build the Google Tasks task object for creating a task."""
+        task_body = {
+            "title": task.title,
+            "status": "completed" if task.status == "completed" else "needsAction",
+        }
+
+        if task.body:
+            task_body["notes"] = task.body
+        if task.due_date:
+            task_body["due"] = self._format_due_date(task.due_date)
+
+        return task_body
+
+    def _update_body(self, task: TaskItem) -> dict:
+        """Build the Google Tasks task object for updating a task."""
+        task_body = {
+            "id": task.id,
+            "title": task.title,
+            "status": "completed" if task.status == "completed" else "needsAction",
+        }
+
+        if task.body is not None:
+            task_body["notes"] = task.body
+        if task.due_date:
+            task_body["due"] = self._format_due_date(task.due_date)
+
+        return task_body
+
     def _api_to_task_item(self, api_task: dict) -> TaskItem:
         """Convert Google Tasks API task to TaskItem.
 
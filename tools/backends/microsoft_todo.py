@@ -1,19 +1,34 @@
 """Microsoft To Do backend implementation using Graph API."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Optional
 from pathlib import Path
 import logging
+import time
 import webbrowser
 
 import msal
 import requests
+from requests.adapters import HTTPAdapter
+
+# Optional: orjson encodes request bodies and decodes Graph responses faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import TaskBackend, TaskItem
-from errors import retry_on_failure, APIError, NetworkError
+from errors import retry_on_failure, APIError, ClientRequestError, NetworkError
 from token_storage import TokenStorage
 
 
+def _nested(api_task: dict, key: str, field: str) -> Optional[str]:
+    """Read a field of a nested Graph object that may be missing or null."""
+    value = api_task.get(key)
+    return value.get(field) if value else None
+
+
 class MicrosoftTodoBackend(TaskBackend):
     """Microsoft To Do backend implementation.
 
@@ -26,6 +41,17 @@ class MicrosoftTodoBackend(TaskBackend):
     SCOPES_APPLICATION = ["https://graph.microsoft.com/.default"]
     # Device code flow automatically includes refresh token support
     SCOPES_DELEGATED = ["Tasks.ReadWrite"]
+    AUTH_MODES = frozenset({"application", "delegated"})
+    # Graph accepts at most 20 requests per $batch call
+    BATCH_LIMIT = 20
+    # Batches sent concurrently when a sync writes more than BATCH_LIMIT tasks
+    BATCH_WORKERS = 4
+    # Upper bound on a Retry-After wait before retrying throttled writes
+    MAX_RETRY_AFTER = 60
+    # Task fields read by _api_to_task_item; $select skips everything else
+    TASK_FIELDS = "id,title,status,importance,body,completedDateTime,dueDateTime"
+    # Tasks requested per page when listing a To Do list
+    PAGE_SIZE = 100
 
     def __init__(
         self,
@@ -44,7 +70,7 @@ class MicrosoftTodoBackend(TaskBackend):
             tenant_id: Azure AD tenant ID
             auth_mode: Authentication mode ("application" or "delegated")
             client_secret: Client secret (required for application mode)
-            token_storage_path: Path to store tokens (for delegated mode)
+            token_storage_path: Path to store tokens
             allow_prompt: Allow interactive authentication prompt (False for cron)
             logger: Optional logger for messages
         """
@@ -55,22 +81,39 @@ class MicrosoftTodoBackend(TaskBackend):
         self.allow_prompt = allow_prompt
         self.access_token = None
         self.logger = logger or logging.getLogger(__name__)
-
-        # Token storage for delegated mode
-        if self.auth_mode == "delegated":
-            self.token_storage = TokenStorage(token_storage_path, logger=self.logger)
-        else:
-            self.token_storage = None
+        # To Do lists rarely change during a run, so they are fetched once
+        self._task_lists: Optional[list[dict]] = None
+        self._lists_by_name: Optional[dict[str, dict]] = None
+        # MSAL client application, built on first use; reusing it keeps
+        # MSAL's in-memory token cache and authority metadata across calls
+        self._msal_app = None
+        # (access token, headers) so requests reuse one headers dict per token
+        self._headers: Optional[tuple[str, dict]] = None
+
+        # One pooled session keeps TLS connections alive across Graph calls;
+        # the pool is sized for the concurrent $batch workers
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.BATCH_WORKERS)
+        self._session.mount("https://", adapter)
 
         # Validate configuration
         if self.auth_mode == "application" and not client_secret:
             raise ValueError("client_secret is required for application mode")
 
-        if self.auth_mode not in ["application", "delegated"]:
+        if self.auth_mode not in self.AUTH_MODES:
             raise ValueError(
                 f"Invalid auth_mode: {auth_mode}. Must be 'application' or 'delegated'"
             )
 
+        # Application tokens are kept apart from delegated ones and per client,
+        # so switching modes or apps never reuses a token with the wrong grant
+        if self.auth_mode == "delegated":
+            self.token_storage = TokenStorage(token_storage_path, logger=self.logger)
+        else:
+            self.token_storage = TokenStorage(
+                token_storage_path, logger=self.logger, filename=f"app_tokens_{client_id}.json"
+            )
+
     @property
     def backend_name(self) -> str:
         """Return backend name."""
@@ -95,17 +138,34 @@ class MicrosoftTodoBackend(TaskBackend):
 
     def _authenticate_application(self):
         """Authenticate using client credentials (application mode)."""
-        authority = f"https://login.microsoftonline.com/{self.tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=authority,
-            client_credential=self.client_secret,
-        )
+        # Reuse the token from a previous run while it is still valid
+        cached_token = self.token_storage.get_access_token()
+        if cached_token:
+            self.access_token = cached_token
+            self.logger.info("Using cached access token")
+            return
 
-        result = app.acquire_token_for_client(scopes=self.SCOPES_APPLICATION)
+        if self._msal_app is None:
+            authority = f"https://login.microsoftonline.com/{self.tenant_id}"
+            self._msal_app = msal.ConfidentialClientApplication(
+                self.client_id,
+                authority=authority,
+                client_credential=self.client_secret,
+            )
+            # The app holds the credential from here on; renewals reuse it
+            self.client_secret = None
+
+        result = self._msal_app.acquire_token_for_client(scopes=self.SCOPES_APPLICATION)
 
         if "access_token" in result:
             self.access_token = result["access_token"]
+            try:
+                self.token_storage.save_tokens(
+                    access_token=result["access_token"], expires_in=result.get("expires_in")
+                )
+            except OSError:
+                # Already logged; the next run just requests a new token
+                pass
             self.logger.info("Authenticated using application mode (client credentials)")
         else:
             error = result.get("error_description", result.get("error", "Unknown error"))
@@ -113,12 +173,6 @@ class MicrosoftTodoBackend(TaskBackend):
 
     def _authenticate_delegated(self):
         """Authenticate using device code flow (delegated mode)."""
-        authority = f"https://login.microsoftonline.com/{self.tenant_id}"
-        app = msal.PublicClientApplication(
-            self.client_id,
-            authority=authority,
-        )
-
         # Try to get cached access token
         cached_token = self.token_storage.get_access_token()
         if cached_token:
@@ -126,6 +180,16 @@ class MicrosoftTodoBackend(TaskBackend):
             self.logger.info("Using cached access token")
             return
 
+        # Built only when MSAL is needed: constructing the app looks up the
+        # authority's metadata over HTTPS
+        if self._msal_app is None:
+            authority = f"https://login.microsoftonline.com/{self.tenant_id}"
+            self._msal_app = msal.PublicClientApplication(
+                self.client_id,
+                authority=authority,
+            )
+        app = self._msal_app
+
         # Try to use refresh token
         refresh_token = self.token_storage.get_refresh_token()
         if refresh_token:
@@ -203,10 +267,16 @@ class MicrosoftTodoBackend(TaskBackend):
         if not self.access_token:
             raise Exception("Not authenticated. Call authenticate() first.")
 
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        # Rebuilt only when authentication has replaced the token
+        if self._headers is None or self._headers[0] != self.access_token:
+            self._headers = (
+                self.access_token,
+                {
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._headers[1]
 
     def _make_request(
         self, method: str, endpoint: str, json_data: Optional[dict] = None, retry: bool = True
@@ -215,13 +285,18 @@ class MicrosoftTodoBackend(TaskBackend):
 
         def _do_request():
             url = f"{self.GRAPH_API_ENDPOINT}{endpoint}"
+            # The headers already declare application/json, so orjson's bytes
+            # can be sent as the raw body
+            body = {"json": json_data}
+            if orjson is not None and json_data is not None:
+                body = {"data": orjson.dumps(json_data)}
             try:
-                response = requests.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     headers=self._get_headers(),
-                    json=json_data,
                     timeout=30,
+                    **body,
                 )
             except requests.exceptions.Timeout as e:
                 raise NetworkError(f"Request timed out: {e}")
@@ -235,37 +310,205 @@ class MicrosoftTodoBackend(TaskBackend):
             elif response.status_code == 429:
                 raise APIError(f"Rate limited: {response.text}")
             elif response.status_code >= 400:
-                raise APIError(f"API request failed: {response.status_code} - {response.text}")
+                raise ClientRequestError(
+                    f"API request failed: {response.status_code} - {response.text}"
+                )
 
-            return response.json() if response.content else {}
+            if not response.content:
+                return {}
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
 
         if retry:
             return retry_on_failure(_do_request, max_retries=3, logger=self.logger)
         else:
             return _do_request()
 
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+
     def get_task_lists(self) -> list[dict]:
-        """Get all To Do lists."""
-        result = self._make_request("GET", "/me/todo/lists")
-        return result.get("value", [])
+        """Get all To Do lists (fetched once per backend instance)."""
+        if self._task_lists is None:
+            self._task_lists = [
+                task_list
+                for page in self._get_pages("/me/todo/lists")
+                for task_list in page
+            ]
+        return self._task_lists
 
     def get_list_by_name(self, name: str) -> Optional[dict]:
         """Get a To Do list by name."""
-        lists = self.get_task_lists()
-        for task_list in lists:
-            if task_list.get("displayName") == name:
-                return task_list
-        return None
+        if self._lists_by_name is None:
+            # Reversed so the first list wins when display names repeat
+            self._lists_by_name = {
+                task_list.get("displayName"): task_list
+                for task_list in reversed(self.get_task_lists())
+            }
+        return self._lists_by_name.get(name)
 
     def get_tasks(self, list_id: str) -> list[TaskItem]:
-        """Get all tasks from a To Do list."""
-        result = self._make_request("GET", f"/me/todo/lists/{list_id}/tasks")
-        tasks = result.get("value", [])
+        """Get all tasks from a To Do list, following @odata.nextLink pages."""
+        endpoint = (
+            f"/me/todo/lists/{list_id}/tasks"
+            f"?$select={self.TASK_FIELDS}&$top={self.PAGE_SIZE}"
+        )
+        tasks = []
+        for page in self._get_pages(endpoint):
+            tasks.extend(self._api_to_task_item(task) for task in page)
+        return tasks
+
+    def _get_pages(self, endpoint: str):
+        """Yield the "value" list of each page of a Graph collection.
+
+        Args:
+            endpoint: Endpoint of the first page, relative to GRAPH_API_ENDPOINT
 
-        return [self._api_to_task_item(task) for task in tasks]
+        Raises:
+            APIError: If @odata.nextLink points outside GRAPH_API_ENDPOINT
+        """
+        while endpoint:
+            result = self._make_request("GET", endpoint)
+            yield result.get("value", [])
+
+            # nextLink is an absolute URL that keeps the query options
+            next_link = result.get("@odata.nextLink")
+            if not next_link:
+                break
+            if not next_link.startswith(self.GRAPH_API_ENDPOINT + "/"):
+                raise APIError(f"Unexpected @odata.nextLink: {next_link}")
+            endpoint = next_link[len(self.GRAPH_API_ENDPOINT) :]
 
     def create_task(self, list_id: str, task: TaskItem) -> TaskItem:
         """Create a new task in a To Do list."""
+        task_data = self._create_payload(task)
+        result = self._make_request("POST", f"/me/todo/lists/{list_id}/tasks", task_data)
+        return self._api_to_task_item(result)
+
+    def update_task(self, list_id: str, task: TaskItem) -> TaskItem:
+        """Update an existing task."""
+        task_data = self._update_payload(task)
+        result = self._make_request("PATCH", f"/me/todo/lists/{list_id}/tasks/{task.id}", task_data)
+        return self._api_to_task_item(result)
+
+    def create_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Create several tasks using Graph JSON batching."""
+        operations = [
+            ("POST", f"/me/todo/lists/{list_id}/tasks", self._create_payload(task))
+            for task in tasks
+        ]
+        return self._batch(operations, lambda i: self.create_task(list_id, tasks[i]))
+
+    def update_tasks(self, list_id: str, tasks: list[TaskItem]) -> list:
+        """Update several tasks using Graph JSON batching."""
+        operations = [
+            ("PATCH", f"/me/todo/lists/{list_id}/tasks/{task.id}", self._update_payload(task))
+            for task in tasks
+        ]
+        return self._batch(operations, lambda i: self.update_task(list_id, tasks[i]))
+
+    def _batch(self, operations: list[tuple[str, str, dict]], retry_one) -> list:
+        """Send task writes through the Graph $batch endpoint.
+
+        Operations are sent BATCH_LIMIT at a time, with up to BATCH_WORKERS
+        batches in flight at once. Throttled or failed-server operations are
+        retried one by one through retry_one, which goes through the normal
+        backoff in _make_request.
+
+        Args:
+            operations: (method, endpoint, json body) tuples
+            retry_one: Callable taking an operation index and performing it alone
+
+        Returns:
+            One entry per operation, in order: a TaskItem or the exception raised
+        """
+        starts = range(0, len(operations), self.BATCH_LIMIT)
+
+        def _send(start):
+            return self._send_batch(operations[start : start + self.BATCH_LIMIT], start, retry_one)
+
+        if len(starts) == 1:
+            return _send(0)
+
+        # Each batch is an independent HTTPS call, so they can overlap
+        results = []
+        with ThreadPoolExecutor(max_workers=min(self.BATCH_WORKERS, len(starts))) as executor:
+            for chunk_results in executor.map(_send, starts):
+                results.extend(chunk_results)
+        return results
+
+    def _send_batch(self, chunk: list[tuple[str, str, dict]], start: int, retry_one) -> list:
+        """Send one $batch request and map its responses back to operations.
+
+        Args:
+            chunk: At most BATCH_LIMIT (method, endpoint, json body) tuples
+            start: Index of the chunk's first operation, passed on to retry_one
+            retry_one: Callable taking an operation index and performing it alone
+
+        Returns:
+            One entry per operation in chunk: a TaskItem or the exception raised
+        """
+        batch_data = {
+            "requests": [
+                {
+                    "id": str(i),
+                    "method": method,
+                    "url": endpoint,
+                    "body": body,
+                    "headers": {"Content-Type": "application/json"},
+                }
+                for i, (method, endpoint, body) in enumerate(chunk)
+            ]
+        }
+
+        try:
+            result = self._make_request("POST", "/$batch", batch_data)
+        except Exception as e:
+            return [e] * len(chunk)
+
+        # Responses may come back in any order; correlate them by request ID
+        responses = {r.get("id"): r for r in result.get("responses", [])}
+        results = []
+        retry_after = 0.0
+        for i in range(len(chunk)):
+            response = responses.get(str(i), {})
+            status = response.get("status", 0)
+            if 200 <= status < 300:
+                body = response.get("body")
+                if isinstance(body, dict) and "id" in body:
+                    results.append(self._api_to_task_item(body))
+                else:
+                    # Not retried: the write may have gone through already
+                    results.append(APIError(f"Unexpected {status} response body: {body!r}"))
+            elif status == 429 or status >= 500 or not status:
+                headers = response.get("headers") or {}
+                try:
+                    retry_after = max(retry_after, float(headers.get("Retry-After", 0)))
+                except ValueError:
+                    pass
+                results.append(None)
+            else:
+                results.append(
+                    ClientRequestError(f"API request failed: {status} - {response.get('body')}")
+                )
+
+        if None in results:
+            # Honor Graph's throttling hint once before retrying individually
+            if retry_after:
+                time.sleep(min(retry_after, self.MAX_RETRY_AFTER))
+            for i, entry in enumerate(results):
+                if entry is None:
+                    try:
+                        results[i] = retry_one(start + i)
+                    except Exception as e:
+                        results[i] = e
+
+        return results
+
+    def _create_payload(self, task: TaskItem) -> dict:
+        """Build the Graph request body for creating a task."""
         task_data = {
             "title": task.title,
             "importance": task.importance or "normal",
@@ -280,11 +523,10 @@ class MicrosoftTodoBackend(TaskBackend):
                 "timeZone": "UTC",
             }
 
-        result = self._make_request("POST", f"/me/todo/lists/{list_id}/tasks", task_data)
-        return self._api_to_task_item(result)
+        return task_data
 
-    def update_task(self, list_id: str, task: TaskItem) -> TaskItem:
-        """Update an existing task."""
+    def _update_payload(self, task: TaskItem) -> dict:
+        """Build the Graph request body for updating a task."""
         task_data = {}
 
         if task.title is not None:
@@ -306,8 +548,7 @@ class MicrosoftTodoBackend(TaskBackend):
                 "timeZone": "UTC",
             }
 
-        result = self._make_request("PATCH", f"/me/todo/lists/{list_id}/tasks/{task.id}", task_data)
-        return self._api_to_task_item(result)
+        return task_data
 
     def delete_task(self, list_id: str, task_id: str) -> None:
         """Delete a task (not currently used, but required by interface)."""
@@ -331,9 +572,9 @@ class MicrosoftTodoBackend(TaskBackend):
             title=api_task.get("title", ""),
             status=status,
             importance=api_task.get("importance", "normal"),
-            body=api_task.get("body", {}).get("content"),
-            completed_datetime=api_task.get("completedDateTime", {}).get("dateTime"),
-            due_date=self._parse_due_date(api_task.get("dueDateTime", {}).get("dateTime")),
+            body=_nested(api_task, "body", "content"),
+            completed_datetime=_nested(api_task, "completedDateTime", "dateTime"),
+            due_date=self._parse_due_date(_nested(api_task, "dueDateTime", "dateTime")),
         )
 
     def _parse_due_date(self, due_value: Optional[str]) -> Optional[date]:
@@ -1,23 +1,95 @@
 """Configuration management for orgplan-todo sync."""
 
+import functools
 import os
+import re
+import stat
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
 
-# Import orgplan config to leverage shared configuration
-try:
-    from orgplan.config import load_config as load_orgplan_config
-except ImportError:
-    load_orgplan_config = None
+# Month to sync in YYYY-MM format (zero-padded, matching orgplan file names)
+_MONTH_RE = re.compile(r"(\d{4})-(0[1-9]|1[0-2])")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orgplan_config_loader():
+    """Import orgplan's config loader on first use (None if orgplan is unavailable).
+
+    Deferred so CLI runs that never resolve the orgplan directory skip the import.
+    """
+    try:
+        from orgplan.config import load_config
+    except ImportError:
+        return None
+    return load_config
 
 
 class Config:
     """Configuration holder for sync operations."""
 
+    __slots__ = (
+        "backend",
+        # Microsoft-specific
+        "client_id",
+        "tenant_id",
+        "auth_mode",
+        "client_secret",
+        # Google-specific
+        "google_client_id",
+        "google_client_secret",
+        # Common
+        "task_list_name",
+        "token_storage_path",
+        "allow_prompt",
+        "orgplan_dir",
+        "_orgplan_dir_stat",
+        "month",
+        "dry_run",
+        "log_file",
+        # Lazily derived
+        "_orgplan_file",
+    )
+
+    _VALID_BACKENDS = frozenset({"microsoft", "google"})
+    _VALID_AUTH_MODES = frozenset({"application", "delegated"})
+
+    # Backend-specific validation rules as (check, message) pairs. A rule fails
+    # when its check returns False; messages are formatted with the config as
+    # ``c``. Cheap required-field checks come first.
+    _MICROSOFT_RULES = (
+        (
+            lambda c: bool(c.client_id),
+            "Microsoft Client ID is required (set MS_CLIENT_ID)",
+        ),
+        (
+            lambda c: bool(c.tenant_id),
+            "Microsoft Tenant ID is required (set MS_TENANT_ID)",
+        ),
+        # Client secret only required for application mode
+        (
+            lambda c: c.auth_mode != "application" or bool(c.client_secret),
+            "Microsoft Client Secret is required for application mode (set MS_CLIENT_SECRET)",
+        ),
+        (
+            lambda c: c.auth_mode in Config._VALID_AUTH_MODES,
+            "Invalid auth mode: {c.auth_mode} (must be 'application' or 'delegated')",
+        ),
+    )
+    _GOOGLE_RULES = (
+        (
+            lambda c: bool(c.google_client_id),
+            "Google Client ID is required (set GOOGLE_CLIENT_ID)",
+        ),
+        (
+            lambda c: bool(c.google_client_secret),
+            "Google Client Secret is required (set GOOGLE_CLIENT_SECRET)",
+        ),
+    )
+
     def __init__(
         self,
         backend: str = "microsoft",
@@ -56,11 +128,13 @@ class Config:
             dry_run: If True, preview changes without applying
             log_file: Optional log file path
         """
-        self.backend = backend.lower()
+        # Interned so comparisons against the literal backend/mode names hit
+        # the identity fast path
+        self.backend = sys.intern(backend.lower())
         # Microsoft-specific
         self.client_id = client_id
         self.tenant_id = tenant_id
-        self.auth_mode = auth_mode.lower()
+        self.auth_mode = sys.intern(auth_mode.lower())
         self.client_secret = client_secret
         # Google-specific
         self.google_client_id = google_client_id
@@ -72,22 +146,49 @@ class Config:
         
         # Orgplan Directory logic with fallback to orgplan core config
         # Use provided arg as primary source if not default "."
-        self.orgplan_dir = self._resolve_orgplan_dir(orgplan_dir)
+        self.orgplan_dir, self._orgplan_dir_stat = self._resolve_orgplan_dir(orgplan_dir)
         
         self.month = month or datetime.now().strftime("%Y-%m")
         self.dry_run = dry_run
         self.log_file = log_file
+        self._orgplan_file = None
+
+    # Backward compatibility aliases
+    @property
+    def todo_list_name(self) -> Optional[str]:
+        """Alias for task_list_name."""
+        return self.task_list_name
 
-        # Backward compatibility aliases
-        self.todo_list_name = task_list_name
-        self.google_task_list_name = task_list_name
+    @property
+    def google_task_list_name(self) -> Optional[str]:
+        """Alias for task_list_name."""
+        return self.task_list_name
 
-        # Derive orgplan file path
-        year, month_num = self.month.split("-")
-        self.orgplan_file = self.orgplan_dir / year / f"{month_num}-notes.md"
+    @property
+    def orgplan_file(self) -> Path:
+        """Orgplan file path for the configured month (derived on first access)."""
+        if self._orgplan_file is None:
+            year, month_num = self.month.split("-")
+            self._orgplan_file = self.orgplan_dir.joinpath(year, f"{month_num}-notes.md")
+        return self._orgplan_file
 
-    def _resolve_orgplan_dir(self, arg_dir: str) -> Path:
-        """Resolve the orgplan data directory."""
+    def _resolve_orgplan_dir(self, arg_dir: str) -> tuple[Path, Optional[os.stat_result]]:
+        """Resolve the orgplan data directory and stat it once.
+
+        The stat result is a snapshot taken at construction time and is reused
+        by validate(); Config objects are short-lived, so it is not refreshed.
+
+        Returns:
+            Tuple of (resolved directory, stat result or None if it can't be stat'ed)
+        """
+        orgplan_dir = self._find_orgplan_dir(arg_dir)
+        try:
+            return orgplan_dir, os.stat(orgplan_dir)
+        except OSError:
+            return orgplan_dir, None
+
+    def _find_orgplan_dir(self, arg_dir: str) -> Path:
+        """Find the orgplan data directory from args, environment, or orgplan config."""
         # 1. CLI Argument / Constructor Argument (if not default ".")
         if arg_dir != ".":
             return Path(arg_dir).resolve()
@@ -98,6 +199,7 @@ class Config:
             return Path(env_dir).resolve()
             
         # 3. Try orgplan core config
+        load_orgplan_config = _get_orgplan_config_loader()
         if load_orgplan_config:
             try:
                 # Try loading without path (uses ORGPLAN_CONFIG env var)
@@ -123,37 +225,14 @@ class Config:
         Returns:
             List of error messages (empty if valid)
         """
-        errors = []
-
         # Validate backend
-        if self.backend not in ["microsoft", "google"]:
-            errors.append(f"Invalid backend: {self.backend} (must be 'microsoft' or 'google')")
-            return errors  # Return early if backend is invalid
+        if self.backend not in self._VALID_BACKENDS:
+            # Return early if backend is invalid
+            return [f"Invalid backend: {self.backend} (must be 'microsoft' or 'google')"]
 
         # Backend-specific validation
-        if self.backend == "microsoft":
-            if not self.client_id:
-                errors.append("Microsoft Client ID is required (set MS_CLIENT_ID)")
-            if not self.tenant_id:
-                errors.append("Microsoft Tenant ID is required (set MS_TENANT_ID)")
-
-            # Validate auth mode
-            if self.auth_mode not in ["application", "delegated"]:
-                errors.append(
-                    f"Invalid auth mode: {self.auth_mode} (must be 'application' or 'delegated')"
-                )
-
-            # Client secret only required for application mode
-            if self.auth_mode == "application" and not self.client_secret:
-                errors.append(
-                    "Microsoft Client Secret is required for application mode (set MS_CLIENT_SECRET)"
-                )
-
-        elif self.backend == "google":
-            if not self.google_client_id:
-                errors.append("Google Client ID is required (set GOOGLE_CLIENT_ID)")
-            if not self.google_client_secret:
-                errors.append("Google Client Secret is required (set GOOGLE_CLIENT_SECRET)")
+        rules = self._MICROSOFT_RULES if self.backend == "microsoft" else self._GOOGLE_RULES
+        errors = [message.format(c=self) for check, message in rules if not check(self)]
 
         # Common validation
         # For Google Tasks, empty task_list_name is valid (uses primary list)
@@ -161,9 +240,10 @@ class Config:
         if not self.task_list_name and self.backend != "google":
             errors.append("Task list name is required for Microsoft (set TODO_LIST_NAME)")
 
-        if not self.orgplan_dir.exists():
+        # Reuse the stat taken when orgplan_dir was resolved
+        if self._orgplan_dir_stat is None:
             errors.append(f"Orgplan directory does not exist: {self.orgplan_dir}")
-        elif not self.orgplan_dir.is_dir():
+        elif not stat.S_ISDIR(self._orgplan_dir_stat.st_mode):
             errors.append(f"Orgplan directory is not a directory: {self.orgplan_dir}")
         
         # Check orgplan file existence (only if we can't create it, but usually validation checks if input is valid)
@@ -175,50 +255,74 @@ class Config:
         #     errors.append(f"Orgplan file for {self.month} does not exist: {self.orgplan_file}")
 
         # Validate month format
-        try:
-            datetime.strptime(self.month, "%Y-%m")
-        except ValueError:
+        if not _MONTH_RE.fullmatch(self.month):
             errors.append(f"Invalid month format: {self.month} (expected YYYY-MM)")
 
         return errors
 
 
-def load_config_from_env() -> dict:
+@dataclass(frozen=True)
+class EnvConfig:
+    """Configuration values read from environment variables and .env file."""
+
+    backend: str = "microsoft"
+    # Microsoft-specific
+    client_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    auth_mode: str = "application"
+    client_secret: Optional[str] = None
+    # Google-specific
+    google_client_id: Optional[str] = None
+    google_client_secret: Optional[str] = None
+    # Common
+    task_list_name: Optional[str] = None
+    token_storage_path: Optional[str] = None
+    orgplan_dir: str = "."
+    month: Optional[str] = None
+    log_file: Optional[str] = None
+
+
+def load_config_from_env() -> EnvConfig:
     """Load configuration from environment variables and .env file.
 
     Returns:
-        Dictionary of configuration values
+        EnvConfig with values from the environment
     """
-    # Load .env file if it exists
+    # Load .env file if it exists (imported here to keep module import cheap)
+    from dotenv import load_dotenv
+
     load_dotenv()
 
-    backend = os.getenv("TASK_BACKEND", "microsoft")
+    # Bind the lookup once; load_dotenv() has already populated os.environ
+    getenv = os.environ.get
+
+    backend = getenv("TASK_BACKEND", "microsoft")
 
     # Choose task list name based on backend
     if backend == "google":
         # For Google, prefer GOOGLE_TASK_LIST_NAME, fallback to TODO_LIST_NAME
-        task_list_name = os.getenv("GOOGLE_TASK_LIST_NAME") or os.getenv("TODO_LIST_NAME")
+        task_list_name = getenv("GOOGLE_TASK_LIST_NAME") or getenv("TODO_LIST_NAME")
     else:
         # For Microsoft, prefer TODO_LIST_NAME, fallback to GOOGLE_TASK_LIST_NAME
-        task_list_name = os.getenv("TODO_LIST_NAME") or os.getenv("GOOGLE_TASK_LIST_NAME")
+        task_list_name = getenv("TODO_LIST_NAME") or getenv("GOOGLE_TASK_LIST_NAME")
 
-    return {
-        "backend": backend,
+    return EnvConfig(
+        backend=backend,
         # Microsoft-specific
-        "client_id": os.getenv("MS_CLIENT_ID"),
-        "tenant_id": os.getenv("MS_TENANT_ID"),
-        "auth_mode": os.getenv("AUTH_MODE", "application"),
-        "client_secret": os.getenv("MS_CLIENT_SECRET"),
+        client_id=getenv("MS_CLIENT_ID"),
+        tenant_id=getenv("MS_TENANT_ID"),
+        auth_mode=getenv("AUTH_MODE", "application"),
+        client_secret=getenv("MS_CLIENT_SECRET"),
         # Google-specific
-        "google_client_id": os.getenv("GOOGLE_CLIENT_ID"),
-        "google_client_secret": os.getenv("GOOGLE_CLIENT_SECRET"),
+        google_client_id=getenv("GOOGLE_CLIENT_ID"),
+        google_client_secret=getenv("GOOGLE_CLIENT_SECRET"),
         # Common
-        "task_list_name": task_list_name,
-        "token_storage_path": os.getenv("TOKEN_STORAGE_PATH"),
-        "orgplan_dir": os.getenv("ORGPLAN_DIR", "."),
-        "month": os.getenv("SYNC_MONTH"),
-        "log_file": os.getenv("LOG_FILE"),
-    }
+        task_list_name=task_list_name,
+        token_storage_path=getenv("TOKEN_STORAGE_PATH"),
+        orgplan_dir=getenv("ORGPLAN_DIR", "."),
+        month=getenv("SYNC_MONTH"),
+        log_file=getenv("LOG_FILE"),
+    )
 
 
 def create_config_from_args(args) -> Config:
@@ -236,36 +340,39 @@ def create_config_from_args(args) -> Config:
     # Load environment defaults
     env_config = load_config_from_env()
 
+    # Read all CLI values from one dict instead of repeated getattr() calls
+    cli = vars(args)
+
     # Determine allow_prompt (inverted from no_prompt flag)
-    allow_prompt = not getattr(args, "no_prompt", False)
+    allow_prompt = not cli.get("no_prompt", False)
 
     # Get task list name (support both --todo-list and --task-list)
     task_list = (
-        getattr(args, "task_list", None)
-        or getattr(args, "todo_list", None)
-        or env_config.get("task_list_name")
+        cli.get("task_list")
+        or cli.get("todo_list")
+        or env_config.task_list_name
     )
 
     # CLI args override environment variables
     config = Config(
-        backend=getattr(args, "backend", None) or env_config.get("backend", "microsoft"),
+        backend=cli.get("backend") or env_config.backend,
         # Microsoft-specific
-        client_id=getattr(args, "client_id", None) or env_config.get("client_id"),
-        tenant_id=getattr(args, "tenant_id", None) or env_config.get("tenant_id"),
-        auth_mode=getattr(args, "auth_mode", None) or env_config.get("auth_mode", "application"),
-        client_secret=getattr(args, "client_secret", None) or env_config.get("client_secret"),
+        client_id=cli.get("client_id") or env_config.client_id,
+        tenant_id=cli.get("tenant_id") or env_config.tenant_id,
+        auth_mode=cli.get("auth_mode") or env_config.auth_mode,
+        client_secret=cli.get("client_secret") or env_config.client_secret,
         # Google-specific
-        google_client_id=env_config.get("google_client_id"),
-        google_client_secret=env_config.get("google_client_secret"),
+        google_client_id=env_config.google_client_id,
+        google_client_secret=env_config.google_client_secret,
         # Common
         task_list_name=task_list,
-        token_storage_path=getattr(args, "token_storage_path", None)
-        or env_config.get("token_storage_path"),
+        token_storage_path=cli.get("token_storage_path")
+        or env_config.token_storage_path,
         allow_prompt=allow_prompt,
-        orgplan_dir=getattr(args, "orgplan_dir", None) or env_config.get("orgplan_dir", "."),
-        month=getattr(args, "month", None) or env_config.get("month"),
-        dry_run=getattr(args, "dry_run", False),
-        log_file=getattr(args, "log_file", None) or env_config.get("log_file"),
+        orgplan_dir=cli.get("orgplan_dir") or env_config.orgplan_dir,
+        month=cli.get("month") or env_config.month,
+        dry_run=cli.get("dry_run", False),
+        log_file=cli.get("log_file") or env_config.log_file,
     )
 
     # Validate configuration
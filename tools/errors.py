@@ -1,5 +1,6 @@
 """Error handling and retry logic for orgplan-todo sync."""
 
+import random
 import time
 from typing import Callable, TypeVar, Optional
 import logging
@@ -38,6 +39,15 @@ class NetworkError(APIError):
     pass
 
 
+class ClientRequestError(APIError):
+    """Raised when the API rejects a request (4xx other than 429).
+
+    Sending the same request again gets the same answer, so it is not retried.
+    """
+
+    pass
+
+
 class AuthenticationError(SyncError):
     """Raised when authentication fails."""
 
@@ -50,8 +60,12 @@ def retry_on_failure(
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     logger: Optional[logging.Logger] = None,
+    retry_on: tuple[type[BaseException], ...] = (APIError,),
 ) -> T:
-    """Retry a function on failure with exponential backoff.
+    """Retry a function on failure with jittered exponential backoff.
+
+    Only exceptions listed in ``retry_on`` are retried; anything else (for
+    example a ConfigurationError) is raised immediately.
 
     Args:
         func: Function to retry
@@ -59,6 +73,8 @@ def retry_on_failure(
         initial_delay: Initial delay in seconds
         backoff_factor: Multiplier for delay after each retry
         logger: Optional logger for retry messages
+        retry_on: Exception types that trigger a retry (default: APIError,
+            which includes NetworkError)
 
     Returns:
         Function return value
@@ -67,26 +83,27 @@ def retry_on_failure(
         Last exception if all retries fail
     """
     delay = initial_delay
-    last_exception = None
 
     for attempt in range(max_retries + 1):
         try:
             return func()
         except Exception as e:
-            last_exception = e
-            if isinstance(e, (AuthenticationError, ConfigurationError)):
+            if not isinstance(e, retry_on) or isinstance(
+                e, (AuthenticationError, ConfigurationError, ClientRequestError)
+            ):
                 raise
 
-            if attempt < max_retries:
-                if logger:
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                time.sleep(delay)
-                delay *= backoff_factor
-            else:
+            if attempt >= max_retries:
                 if logger:
                     logger.error(f"All {max_retries + 1} attempts failed")
+                raise
 
-    raise last_exception
+            # Jitter spreads out retries from concurrent runs hitting the same API
+            sleep_for = delay * (0.5 + random.random())
+            if logger:
+                logger.warning(
+                    f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
+                    f"Retrying in {sleep_for:.1f}s..."
+                )
+            time.sleep(sleep_for)
+            delay *= backoff_factor
@@ -1,4 +1,4 @@
-"""File-based locking to prevent concurrent sync runs."""
+"""OS-level file locking to prevent concurrent sync runs."""
 
 import os
 import time
@@ -6,9 +6,54 @@ from pathlib import Path
 from typing import Optional
 import logging
 
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        """Try to take an exclusive lock on the first byte of the file."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock(fd: int):
+        """Release the lock taken by _try_lock."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        """Try to take an exclusive advisory lock on the file."""
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock(fd: int):
+        """Release the lock taken by _try_lock."""
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+# Optional: inotify lets a waiting acquire wake as soon as the lock is released
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
 
 class SyncLock:
-    """File-based lock to prevent concurrent sync execution."""
+    """OS-level file lock to prevent concurrent sync execution.
+
+    Uses flock on POSIX and msvcrt.locking on Windows. The operating system
+    drops the lock when the holding process exits, so a crashed sync never
+    leaves a lock behind. The lock file itself persists between runs and only
+    records the PID and start time of the last holder.
+    """
 
     def __init__(self, lock_file: Path, logger: Optional[logging.Logger] = None):
         """Initialize sync lock.
@@ -20,75 +65,122 @@ class SyncLock:
         self.lock_file = lock_file
         self.logger = logger or logging.getLogger(__name__)
         self.acquired = False
+        self._fd = None
+        # PID doesn't change within a process; only the timestamp is formatted per acquire
+        self._pid_line = f"PID: {os.getpid()}\n".encode("ascii")
 
     def acquire(self, timeout: float = 0, stale_threshold: float = 3600) -> bool:
         """Acquire the lock.
 
         Args:
             timeout: Maximum seconds to wait for lock (0 = don't wait)
-            stale_threshold: Seconds after which lock is considered stale
+            stale_threshold: Unused; kept for backward compatibility. Locks held
+                by dead processes are released by the OS.
 
         Returns:
             True if lock was acquired, False otherwise
         """
-        start_time = time.time()
+        try:
+            fd = self._open_lock_file()
+        except OSError as e:
+            self.logger.error(f"Failed to open lock file: {e}")
+            return False
 
-        while True:
-            # Check if lock file exists
-            if self.lock_file.exists():
-                # Check if lock is stale
-                lock_age = time.time() - self.lock_file.stat().st_mtime
-
-                if lock_age > stale_threshold:
-                    self.logger.warning(f"Lock file is stale ({lock_age:.0f}s old), removing")
-                    try:
-                        self.lock_file.unlink()
-                    except OSError as e:
-                        self.logger.error(f"Failed to remove stale lock: {e}")
-                        return False
-                else:
-                    # Lock is held by another process
-                    if timeout == 0:
-                        self.logger.error(
-                            "Another sync is already running. " f"Lock file: {self.lock_file}"
-                        )
-                        return False
-
-                    # Wait and retry
-                    elapsed = time.time() - start_time
-                    if elapsed >= timeout:
-                        self.logger.error(f"Timeout waiting for lock after {elapsed:.1f}s")
-                        return False
-
-                    time.sleep(1)
-                    continue
-
-            # Try to create lock file
-            try:
-                # Write PID and timestamp to lock file
-                self.lock_file.parent.mkdir(parents=True, exist_ok=True)
-                self.lock_file.write_text(
-                    f"PID: {os.getpid()}\n" f"Started: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        start_time = time.time()
+        attempt = 0
+
+        while not _try_lock(fd):
+            # Lock is held by another process
+            if timeout == 0:
+                os.close(fd)
+                self.logger.error(
+                    "Another sync is already running. " f"Lock file: {self.lock_file}"
                 )
-                self.acquired = True
-                self.logger.debug(f"Acquired lock: {self.lock_file}")
-                return True
-            except OSError as e:
-                self.logger.error(f"Failed to create lock file: {e}")
                 return False
 
+            # Wait and retry
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
+                os.close(fd)
+                self.logger.error(f"Timeout waiting for lock after {elapsed:.1f}s")
+                return False
+
+            self._wait_for_release(timeout - elapsed, attempt)
+            attempt += 1
+
+        # Record PID and timestamp for operator visibility (not used for locking)
+        try:
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, self._payload())
+        except OSError as e:
+            self.logger.warning(f"Could not write lock file details: {e}")
+
+        self._fd = fd
+        self.acquired = True
+        self.logger.debug(f"Acquired lock: {self.lock_file}")
+        return True
+
+    def _payload(self) -> bytes:
+        """Return the PID/start-time record written to the lock file."""
+        started = time.strftime("%Y-%m-%d %H:%M:%S").encode("ascii")
+        return self._pid_line + b"Started: " + started + b"\n"
+
+    def _open_lock_file(self) -> int:
+        """Open (creating if needed) the lock file and return its descriptor.
+
+        The parent directory is only created when the first open fails, so the
+        common case costs a single open syscall.
+        """
+        flags = os.O_CREAT | os.O_RDWR
+        try:
+            return os.open(self.lock_file, flags, 0o644)
+        except FileNotFoundError:
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self.lock_file, flags, 0o644)
+
+    def _wait_for_release(self, max_wait: float, attempt: int = 0):
+        """Wait until the lock holder may have released, or max_wait seconds pass.
+
+        Uses inotify on Linux when inotify_simple is installed; otherwise polls,
+        starting at 50ms and backing off by 1.5x per attempt. Each wait is
+        capped at one second so a release that happens before the watch is
+        armed is never missed for long. Callers must retry the lock after this
+        returns.
+
+        Args:
+            max_wait: Maximum seconds to wait
+            attempt: Number of waits already made during this acquire
+        """
+        max_wait = min(max(max_wait, 0.0), 1.0)
+
+        if INotify is None:
+            time.sleep(min(max_wait, 0.05 * 1.5 ** min(attempt, 10)))
+            return
+
+        try:
+            with INotify() as inotify:
+                # The holder's descriptor is writable, so closing it fires CLOSE_WRITE
+                inotify.add_watch(self.lock_file, inotify_flags.CLOSE_WRITE)
+                inotify.read(timeout=int(max_wait * 1000))
+        except OSError as e:
+            self.logger.debug(f"inotify wait unavailable, polling instead: {e}")
+            time.sleep(max_wait)
+
     def release(self):
         """Release the lock."""
         if not self.acquired:
             return
 
         try:
-            if self.lock_file.exists():
-                self.lock_file.unlink()
-                self.logger.debug(f"Released lock: {self.lock_file}")
+            _unlock(self._fd)
+            self.logger.debug(f"Released lock: {self.lock_file}")
         except OSError as e:
-            self.logger.error(f"Failed to remove lock file: {e}")
+            self.logger.error(f"Failed to release lock: {e}")
         finally:
+            # Closing the descriptor also drops the lock if unlocking failed
+            os.close(self._fd)
+            self._fd = None
             self.acquired = False
 
     def __enter__(self):
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import re
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +18,72 @@ except ImportError:
     parse_title_parts = None
     orgplan_parse_timestamps = None
 
+# orgplan task states mapped to the status blocks used in task lines
+_STATE_TO_STATUS = {
+    "done": "DONE",
+    "pending": "PENDING",
+    "delegated": "DELEGATED",
+    "canceled": "CANCELED",
+}
+
+
+# Regex patterns (module level so hot paths skip the attribute lookup)
+_STATUS_PATTERN = re.compile(r"\[(DONE|PENDING|DELEGATED|CANCELED)\]")
+_PRIORITY_PATTERN = re.compile(r"#p(\d+)")
+# Priority tag as returned by orgplan's parse_title_parts (no leading '#')
+_PRIORITY_TAG_PATTERN = re.compile(r"p(\d+)")
+_TIME_ESTIMATE_PATTERN = re.compile(r"#\d+[hd]")
+_BLOCKED_PATTERN = re.compile(r"#blocked")
+# Custom tags pattern - matches any remaining hashtags (e.g., #uma, #tag, #custom)
+_CUSTOM_TAG_PATTERN = re.compile(r"#\w+")
+# Status block or priority tag, whichever comes next (group 1 or group 2)
+_STATUS_PRIORITY_PATTERN = re.compile(
+    f"{_STATUS_PATTERN.pattern}|{_PRIORITY_PATTERN.pattern}"
+)
+# Everything stripped from a description in the fallback path, in one pass
+_ALL_TAGS_PATTERN = re.compile(
+    "|".join(
+        p.pattern
+        for p in (
+            _STATUS_PATTERN,
+            _PRIORITY_PATTERN,
+            _TIME_ESTIMATE_PATTERN,
+            _BLOCKED_PATTERN,
+            _CUSTOM_TAG_PATTERN,
+        )
+    )
+)
+# Timestamp patterns
+_TIMESTAMP_PATTERN = re.compile(
+    r"<(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})"
+    r"(?:\s+\w+)?"
+    r"(?:\s+(?P<hour>\d{2}):(?P<minute>\d{2}))?"
+    r">"
+)
+# Plain, DEADLINE: or SCHEDULED: timestamps in one pass (keyword group names the prefix)
+_DUE_TIMESTAMP_PATTERN = re.compile(
+    r"(?:(?P<keyword>DEADLINE|SCHEDULED):\s*)?"
+    r"<(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})"
+    r"(?:\s+\w+)?"
+    r"(?:\s+(?P<hour>\d{2}):(?P<minute>\d{2}))?"
+    r">"
+)
+_DEADLINE_PATTERN = re.compile(r"DEADLINE:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)")
+_SCHEDULED_PATTERN = re.compile(r"SCHEDULED:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)")
+# Any due marker _strip_due_markers removes, as one alternation
+_DUE_MARKERS_PATTERN = re.compile(
+    "|".join(
+        p.pattern for p in (_DEADLINE_PATTERN, _SCHEDULED_PATTERN, _TIMESTAMP_PATTERN)
+    )
+)
+# Backend ID patterns
+_MS_TODO_ID_PATTERN = re.compile(r"<!--\s*ms-todo-id:\s*([^\s]+)\s*-->")
+_GOOGLE_TASKS_ID_PATTERN = re.compile(r"<!--\s*google-tasks-id:\s*([^\s]+)\s*-->")
+# A line holding any backend ID marker
+_ANY_ID_PATTERN = re.compile(
+    "|".join(p.pattern for p in (_MS_TODO_ID_PATTERN, _GOOGLE_TASKS_ID_PATTERN))
+)
+
 
 @dataclass
 class OrgplanTask:
@@ -33,30 +101,37 @@ class OrgplanTask:
     ms_todo_id: Optional[str] = None  # Microsoft To Do task ID if synced
     google_tasks_id: Optional[str] = None  # Google Tasks task ID if synced
     line_number: int = 0  # Line number in the file
+    detail_line_number: int = 0  # Line number of the detail section header, if any
 
 
 class OrgplanParser:
     """Parser for orgplan markdown files."""
 
-    # Regex patterns
-    STATUS_PATTERN = re.compile(r"\[(DONE|PENDING|DELEGATED|CANCELED)\]")
-    PRIORITY_PATTERN = re.compile(r"#p(\d+)")
-    TIME_ESTIMATE_PATTERN = re.compile(r"#\d+[hd]")
-    BLOCKED_PATTERN = re.compile(r"#blocked")
-    # Custom tags pattern - matches any remaining hashtags (e.g., #uma, #tag, #custom)
-    CUSTOM_TAG_PATTERN = re.compile(r"#\w+")
-    # Timestamp patterns
-    TIMESTAMP_PATTERN = re.compile(
-        r"<(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})"
-        r"(?:\s+\w+)?"
-        r"(?:\s+(?P<hour>\d{2}):(?P<minute>\d{2}))?"
-        r">"
-    )
-    DEADLINE_PATTERN = re.compile(r"DEADLINE:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)")
-    SCHEDULED_PATTERN = re.compile(r"SCHEDULED:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)")
-    # Backend ID patterns
-    MS_TODO_ID_PATTERN = re.compile(r"<!--\s*ms-todo-id:\s*([^\s]+)\s*-->")
-    GOOGLE_TASKS_ID_PATTERN = re.compile(r"<!--\s*google-tasks-id:\s*([^\s]+)\s*-->")
+    # Class-level aliases of the module patterns (used by SyncEngine and callers)
+    STATUS_PATTERN = _STATUS_PATTERN
+    PRIORITY_PATTERN = _PRIORITY_PATTERN
+    PRIORITY_TAG_PATTERN = _PRIORITY_TAG_PATTERN
+    TIME_ESTIMATE_PATTERN = _TIME_ESTIMATE_PATTERN
+    BLOCKED_PATTERN = _BLOCKED_PATTERN
+    CUSTOM_TAG_PATTERN = _CUSTOM_TAG_PATTERN
+    STATUS_PRIORITY_PATTERN = _STATUS_PRIORITY_PATTERN
+    ALL_TAGS_PATTERN = _ALL_TAGS_PATTERN
+    TIMESTAMP_PATTERN = _TIMESTAMP_PATTERN
+    DUE_TIMESTAMP_PATTERN = _DUE_TIMESTAMP_PATTERN
+    DEADLINE_PATTERN = _DEADLINE_PATTERN
+    SCHEDULED_PATTERN = _SCHEDULED_PATTERN
+    DUE_MARKERS_PATTERN = _DUE_MARKERS_PATTERN
+    MS_TODO_ID_PATTERN = _MS_TODO_ID_PATTERN
+    GOOGLE_TASKS_ID_PATTERN = _GOOGLE_TASKS_ID_PATTERN
+    ANY_ID_PATTERN = _ANY_ID_PATTERN
+
+    # Loaded files shared across parser instances, keyed by path and
+    # validated against (mtime_ns, size, inode) before reuse
+    _file_cache: dict[Path, tuple[tuple[int, int, int], tuple[str, ...]]] = {}
+    # parse_tasks() results for unedited loads, validated the same way
+    _parsed_cache: dict[
+        Path, tuple[tuple[int, int, int], tuple[OrgplanTask, ...], tuple[str, ...]]
+    ] = {}
 
     def __init__(self, file_path: Path):
         """Initialize parser with orgplan file path.
@@ -65,20 +140,60 @@ class OrgplanParser:
             file_path: Path to the orgplan markdown file
         """
         self.file_path = file_path
-        self.content = ""
         self.lines = []
+        # Format warnings found by the last parse_tasks() (see validate())
+        self.warnings: list[str] = []
+        # Joined form of self.lines; None until requested or after a mutation
+        self._content: Optional[str] = None
+        # Pristine copies of the last parse_tasks() result for the current lines
+        self._parsed_tasks: Optional[tuple[OrgplanTask, ...]] = None
+        # File signature while self.lines still match the file as loaded
+        self._loaded_signature: Optional[tuple[int, int, int]] = None
+        # Stripped top-level header -> occurrences; built on demand, then kept
+        # in step by the mutators so lookups for missing sections skip a scan
+        self._header_counts: Optional[Counter] = None
+
+    def _lines_changed(self):
+        """Drop state derived from self.lines after they were replaced or edited."""
+        self._content = None
+        self._parsed_tasks = None
+        self._loaded_signature = None
+
+    @property
+    def content(self) -> str:
+        """File content as the current lines joined with newlines.
+
+        Built on first access and reused until a mutator changes self.lines.
+        """
+        if self._content is None:
+            self._content = "\n".join(self.lines)
+        return self._content
 
     def load(self):
-        """Load the orgplan file."""
+        """Load the orgplan file.
+
+        Reuses the previously read content when the file is unchanged on disk.
+        """
+        st = self.file_path.stat()
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = OrgplanParser._file_cache.get(self.file_path)
+        self._lines_changed()
+        self._header_counts = None
+        self._loaded_signature = signature
+        if cached and cached[0] == signature:
+            self.lines = list(cached[1])
+            return
+
+        # Read once; a failed UTF-8 decode retries on the same bytes
+        data = self.file_path.read_bytes()
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                self.content = f.read()
+            text = data.decode("utf-8")
         except UnicodeDecodeError:
             # Fallback to CP1252 (Windows default) if UTF-8 fails
-            with open(self.file_path, "r", encoding="cp1252") as f:
-                self.content = f.read()
-        
-        self.lines = self.content.splitlines()
+            text = data.decode("cp1252")
+
+        self.lines = text.splitlines()
+        OrgplanParser._file_cache[self.file_path] = (signature, tuple(self.lines))
 
     def validate(self) -> list[str]:
         """Validate orgplan file format.
@@ -86,71 +201,133 @@ class OrgplanParser:
         Returns:
             List of validation warnings (empty if valid)
         """
-        warnings = []
-
-        if not self.lines:
-            self.load()
-
-        # Check for TODO List section
-        has_todo_section = False
-        for line in self.lines:
-            if line.strip() == "# TODO List":
-                has_todo_section = True
-                break
-
-        if not has_todo_section:
-            warnings.append("File is missing '# TODO List' section")
-
-        # Check for malformed task lines
-        in_todo_section = False
-        for i, line in enumerate(self.lines, 1):
-            if line.strip() == "# TODO List":
-                in_todo_section = True
-                continue
-            elif in_todo_section and line.startswith("# "):
-                in_todo_section = False
-
-            if in_todo_section and line.strip() and not line.startswith("- "):
-                if not line.startswith("#"):  # Allow headers
-                    warnings.append(
-                        f"Line {i}: TODO List section should only contain task items (starting with '- ')"
-                    )
-
-        return warnings
+        # The checks run as part of the parse, whose result is kept for the
+        # parse_tasks() call that usually follows
+        if self._parsed_tasks is None:
+            self.parse_tasks()
+        return list(self.warnings)
 
     def parse_tasks(self) -> list[OrgplanTask]:
         """Parse all tasks from the TODO List section.
 
+        The result is reused until the lines are edited or reloaded; each call
+        gets its own task objects.
+
         Returns:
             List of OrgplanTask objects
         """
+        if self._parsed_tasks is not None:
+            return [replace(task) for task in self._parsed_tasks]
+
         if not self.lines:
             self.load()
 
+        signature = self._loaded_signature
+        parsed = OrgplanParser._parsed_cache.get(self.file_path)
+        if signature is not None and parsed and parsed[0] == signature:
+            # Unedited lines of an unchanged file: copy the earlier result
+            self._parsed_tasks = parsed[1]
+            self.warnings = list(parsed[2])
+            return [replace(task) for task in parsed[1]]
+
         tasks = []
+        warnings = []
+        header_index = {}
         in_todo_section = False
-        todo_start_line = 0
+        todo_section_done = False
+        has_todo_section = False
+        in_checked_section = False
 
-        # Find TODO List section
+        # Single pass: collect task lines from the TODO List section, check the
+        # format and index every top-level header for the detail-section lookup
         for i, line in enumerate(self.lines):
-            if line.strip() == "# TODO List":
+            stripped = line.strip()
+            if not stripped:
+                # Blank lines are never headers, tasks or format problems
+                continue
+            is_todo_header = stripped == "# TODO List"
+            if stripped.startswith("# "):
+                header_index.setdefault(stripped, i)
+
+            # Format checks cover every TODO List section, not just the first
+            if is_todo_header:
+                has_todo_section = True
+                in_checked_section = True
+            elif in_checked_section and line.startswith("# "):
+                in_checked_section = False
+            elif in_checked_section and not line.startswith(("- ", "#")):
+                warnings.append(
+                    f"Line {i + 1}: TODO List section should only contain task items (starting with '- ')"
+                )
+
+            if todo_section_done:
+                continue
+            if is_todo_header:
                 in_todo_section = True
-                todo_start_line = i + 1
             elif in_todo_section and line.startswith("# "):
                 # End of TODO section (next top-level header)
-                break
-            elif in_todo_section and line.strip().startswith("- "):
+                in_todo_section = False
+                todo_section_done = True
+            elif in_todo_section and stripped.startswith("- "):
                 # Parse task line
                 task = self._parse_task_line(line, i + 1)
                 if task:
                     tasks.append(task)
 
-        # Parse detail sections for each task
+        if not has_todo_section:
+            # No section means no task-line warnings, so this is still the first entry
+            warnings.append("File is missing '# TODO List' section")
+        self.warnings = warnings
+
+        # Parse detail sections for tasks that have one
         for task in tasks:
-            self._parse_detail_section(task)
+            if f"# {task.description}" in header_index:
+                self._parse_detail_section(task, header_index)
+
+        self._parsed_tasks = tuple(replace(task) for task in tasks)
+        if signature is not None:
+            OrgplanParser._parsed_cache[self.file_path] = (
+                signature,
+                self._parsed_tasks,
+                tuple(warnings),
+            )
 
         return tasks
 
+    def _section_body_lines(self, section_header: str, section_start: int) -> list[str]:
+        """Collect the lines of a detail section that starts at section_start.
+
+        Args:
+            section_header: Stripped header line of the section
+            section_start: Index of the header in self.lines
+
+        Returns:
+            Lines up to the next top-level header (repeats of this one are skipped)
+        """
+        section_lines = []
+        for line in itertools.islice(self.lines, section_start + 1, None):
+            if line.strip() == section_header:
+                # Repeated header for the same task continues the section
+                continue
+            if line.startswith("# "):
+                # Next top-level section
+                break
+            section_lines.append(line)
+        return section_lines
+
+    def _index_headers(self) -> dict[str, int]:
+        """Map each top-level header (stripped) to the index of its first occurrence.
+
+        Returns:
+            Dictionary of header line to 0-based index in self.lines
+        """
+        header_index = {}
+        for i, line in enumerate(self.lines):
+            stripped = line.strip()
+            if stripped.startswith("# "):
+                header_index.setdefault(stripped, i)
+        return header_index
+
     def _parse_task_line(self, line: str, line_number: int) -> Optional[OrgplanTask]:
         """Parse a single task line from TODO list.
 
@@ -170,43 +347,43 @@ class OrgplanParser:
             state, tags, title = parse_title_parts(content)
             
             # Map state
-            status = None
-            if state == "done":
-                status = "DONE"
-            elif state == "pending":
-                status = "PENDING"
-            elif state == "delegated":
-                status = "DELEGATED"
-            elif state == "canceled":
-                status = "CANCELED"
+            status = _STATE_TO_STATUS.get(state)
             
             # Map priority from tags
-            priority = None
-            for tag in tags:
-                if tag.startswith("p") and tag[1:].isdigit():
-                    priority = int(tag[1:])
-                    break
+            priority = next(
+                (
+                    int(m.group(1))
+                    for tag in tags
+                    if (m := _PRIORITY_TAG_PATTERN.fullmatch(tag))
+                ),
+                None,
+            )
             
             description = self._strip_due_markers(title)
         else:
             # Legacy regex parsing (fallback)
-            
-            # Extract status
-            status_match = self.STATUS_PATTERN.search(content)
-            status = status_match.group(1) if status_match else None
+            # Status blocks need "[" and tags need "#"; plain lines skip the regexes
+            has_status = "[" in content
+            has_tags = "#" in content
 
-            # Extract priority
-            priority_match = self.PRIORITY_PATTERN.search(content)
-            priority = int(priority_match.group(1)) if priority_match else None
+            # Extract status and priority (first of each) in one scan
+            status = None
+            priority = None
+            if has_status or has_tags:
+                for match in _STATUS_PRIORITY_PATTERN.finditer(content):
+                    status_text, priority_text = match.groups()
+                    if status_text:
+                        if status is None:
+                            status = status_text
+                    elif priority is None:
+                        priority = int(priority_text)
+                    if status is not None and priority is not None:
+                        break
 
             # Remove status blocks, tags, and other metadata to get description
             description = content
-            description = self.STATUS_PATTERN.sub("", description)
-            description = self.PRIORITY_PATTERN.sub("", description)
-            description = self.TIME_ESTIMATE_PATTERN.sub("", description)
-            description = self.BLOCKED_PATTERN.sub("", description)
-            # Remove any remaining custom tags (e.g., #uma, #tag, #custom)
-            description = self.CUSTOM_TAG_PATTERN.sub("", description)
+            if has_status or has_tags:
+                description = _ALL_TAGS_PATTERN.sub("", description)
             description = self._strip_due_markers(description)
             description = description.strip()
 
@@ -223,36 +400,35 @@ class OrgplanParser:
             line_number=line_number,
         )
 
-    def _parse_detail_section(self, task: OrgplanTask):
+    def _parse_detail_section(
+        self, task: OrgplanTask, header_index: Optional[dict[str, int]] = None
+    ):
         """Parse detail section for a task.
 
         Args:
             task: OrgplanTask to update with detail section info
+            header_index: Optional header index from _index_headers() (built if omitted)
         """
+        if header_index is None:
+            header_index = self._index_headers()
+
         # Find the detail section header matching the task description
         section_header = f"# {task.description}"
-        in_section = False
-        section_lines = []
-
-        for line in self.lines:
-            if line.strip() == section_header:
-                in_section = True
-                continue
-            elif in_section:
-                if line.startswith("# "):
-                    # Next top-level section
-                    break
-                section_lines.append(line)
+        section_start = header_index.get(section_header)
+        if section_start is None:
+            return
+        task.detail_line_number = section_start + 1
 
+        section_lines = self._section_body_lines(section_header, section_start)
         if section_lines:
             task.detail_section = "\n".join(section_lines).strip()
 
             # Extract backend IDs if present
-            ms_id_match = self.MS_TODO_ID_PATTERN.search(task.detail_section)
+            ms_id_match = _MS_TODO_ID_PATTERN.search(task.detail_section)
             if ms_id_match:
                 task.ms_todo_id = ms_id_match.group(1)
 
-            google_id_match = self.GOOGLE_TASKS_ID_PATTERN.search(task.detail_section)
+            google_id_match = _GOOGLE_TASKS_ID_PATTERN.search(task.detail_section)
             if google_id_match:
                 task.google_tasks_id = google_id_match.group(1)
 
@@ -263,6 +439,91 @@ class OrgplanParser:
             if task.due_date is None:
                 task.due_date = self._select_due_date(deadlines, scheduled, timestamps)
 
+    def _has_header(self, header: str) -> bool:
+        """Check whether any line strips to the given top-level header."""
+        if self._header_counts is None:
+            self._header_counts = Counter(
+                stripped
+                for stripped in map(str.strip, self.lines)
+                if stripped.startswith("# ")
+            )
+        return self._header_counts[header] > 0
+
+    def _track_replaced_lines(self, removed, added):
+        """Keep the header counts in step with lines an edit removes and adds.
+
+        Args:
+            removed: Lines taken out of self.lines
+            added: Lines put into self.lines
+        """
+        counts = self._header_counts
+        if counts is None:
+            return
+        for line in removed:
+            stripped = line.strip()
+            if stripped.startswith("# "):
+                counts[stripped] -= 1
+        for line in added:
+            stripped = line.strip()
+            if stripped.startswith("# "):
+                counts[stripped] += 1
+
+    def _replace_line(self, idx: int, new_line: str):
+        """Overwrite one line of self.lines, keeping derived state current."""
+        self._track_replaced_lines((self.lines[idx],), (new_line,))
+        self.lines[idx] = new_line
+        self._lines_changed()
+
+    def _find_detail_header(self, task: OrgplanTask) -> int:
+        """Find the index of a task's detail section header.
+
+        Checks task.detail_line_number first and only searches the file when
+        that line no longer holds the header (lines moved or the description
+        changed).
+
+        Args:
+            task: Task whose detail section to find
+
+        Returns:
+            0-based index into self.lines, or -1 if the task has no section
+        """
+        section_header = f"# {task.description}"
+        idx = task.detail_line_number - 1
+        if 0 <= idx < len(self.lines) and self.lines[idx].strip() == section_header:
+            return idx
+        if not self._has_header(section_header):
+            return -1
+
+        for i, line in enumerate(self.lines):
+            if line.strip() == section_header:
+                task.detail_line_number = i + 1
+                return i
+        return -1
+
+    def _task_line_index(self, task: OrgplanTask) -> int:
+        """Find the index of a task's line, following it if edits moved it.
+
+        task.line_number is trusted while that line still reads task.raw_line;
+        otherwise the line is looked up by its text and line_number corrected.
+
+        Args:
+            task: Task whose line to find
+
+        Returns:
+            0-based index into self.lines (task.line_number - 1 if not found)
+        """
+        idx = task.line_number - 1
+        if not task.raw_line or (
+            0 <= idx < len(self.lines) and self.lines[idx] == task.raw_line
+        ):
+            return idx
+        try:
+            idx = self.lines.index(task.raw_line)
+        except ValueError:
+            return idx
+        task.line_number = idx + 1
+        return idx
+
     def update_task_status(self, task: OrgplanTask, new_status: Optional[str]):
         """Update task status in the orgplan file.
 
@@ -274,13 +535,13 @@ class OrgplanParser:
             self.load()
 
         # Find and update the task line
-        line_idx = task.line_number - 1
+        line_idx = self._task_line_index(task)
         if line_idx >= len(self.lines):
             return
 
         task.status = new_status
         new_line = self._format_task_line(task)
-        self.lines[line_idx] = new_line
+        self._replace_line(line_idx, new_line)
         task.raw_line = new_line
 
     def update_task_description(self, task: OrgplanTask, new_description: str):
@@ -293,13 +554,13 @@ class OrgplanParser:
         if not self.lines:
             self.load()
 
-        line_idx = task.line_number - 1
+        line_idx = self._task_line_index(task)
         if line_idx >= len(self.lines):
             return
 
         task.description = new_description
         new_line = self._format_task_line(task)
-        self.lines[line_idx] = new_line
+        self._replace_line(line_idx, new_line)
         task.raw_line = new_line
 
     def update_task_priority(self, task: OrgplanTask, new_priority: Optional[int]):
@@ -312,13 +573,13 @@ class OrgplanParser:
         if not self.lines:
             self.load()
 
-        line_idx = task.line_number - 1
+        line_idx = self._task_line_index(task)
         if line_idx >= len(self.lines):
             return
 
         task.priority = new_priority
         new_line = self._format_task_line(task)
-        self.lines[line_idx] = new_line
+        self._replace_line(line_idx, new_line)
         task.raw_line = new_line
 
     def update_task_due_date(
@@ -334,7 +595,7 @@ class OrgplanParser:
         if not self.lines:
             self.load()
 
-        line_idx = task.line_number - 1
+        line_idx = self._task_line_index(task)
         if line_idx >= len(self.lines):
             return
 
@@ -342,7 +603,7 @@ class OrgplanParser:
         task.due_marker_style = due_marker_style if new_due_date else None
 
         new_line = self._format_task_line(task)
-        self.lines[line_idx] = new_line
+        self._replace_line(line_idx, new_line)
         task.raw_line = new_line
 
     def add_task(
@@ -378,16 +639,18 @@ class OrgplanParser:
         # Find TODO List section and insert
         todo_section_end = 0
         for i, line in enumerate(self.lines):
-            if line.strip() == "# TODO List":
+            stripped = line.strip()
+            if stripped == "# TODO List":
                 todo_section_end = i + 1
             elif todo_section_end > 0 and line.startswith("# "):
                 # Found next section, insert before it
                 break
-            elif todo_section_end > 0 and line.strip().startswith("- "):
+            elif todo_section_end > 0 and stripped.startswith("- "):
                 todo_section_end = i + 1
 
         # Insert the new task
         self.lines.insert(todo_section_end, task_line)
+        self._lines_changed()
 
         task.raw_line = task_line
         task.line_number = todo_section_end + 1
@@ -404,66 +667,115 @@ class OrgplanParser:
         if not self.lines:
             self.load()
 
-        # Check if detail section already exists
-        section_header = f"# {task.description}"
-        section_exists = False
-        section_start = -1
+        # Every path below may append or rewrite lines
+        self._lines_changed()
 
-        for i, line in enumerate(self.lines):
-            if line.strip() == section_header:
-                section_exists = True
-                section_start = i
-                break
+        # Check if detail section already exists
+        section_start = self._find_detail_header(task)
 
-        if not section_exists:
+        if section_start == -1:
             # Add new section at the end
+            section_header = f"# {task.description}"
             self.lines.append("")
             self.lines.append(section_header)
             self.lines.append("")
+            self._track_replaced_lines((), (section_header,))
             section_start = len(self.lines) - 2
+            task.detail_line_number = section_start + 1
 
         # Mapping of backend ID names to their patterns and marker formats
         id_mappings = {
-            "ms_todo_id": (self.MS_TODO_ID_PATTERN, "ms-todo-id"),
-            "google_tasks_id": (self.GOOGLE_TASKS_ID_PATTERN, "google-tasks-id"),
+            "ms_todo_id": (_MS_TODO_ID_PATTERN, "ms-todo-id"),
+            "google_tasks_id": (_GOOGLE_TASKS_ID_PATTERN, "google-tasks-id"),
         }
 
         # Add or update backend ID markers
+        existing, insert_pos = self._scan_id_markers(section_start, id_mappings)
         for id_name, id_value in backend_ids.items():
             if not id_value or id_name not in id_mappings:
                 continue
 
-            pattern, marker_name = id_mappings[id_name]
+            _, marker_name = id_mappings[id_name]
             id_marker = f"<!-- {marker_name}: {id_value} -->"
 
-            # Check if ID already exists in section
-            id_found = False
-            for i in range(section_start + 1, len(self.lines)):
-                if self.lines[i].startswith("# "):
-                    break
-                if pattern.search(self.lines[i]):
-                    # Update existing ID
-                    self.lines[i] = id_marker
-                    setattr(task, id_name, id_value)
-                    id_found = True
-                    break
-
-            if not id_found:
-                # Insert new ID marker after section header
-                # Find where to insert (after other ID markers if any)
-                insert_pos = section_start + 1
-                for i in range(section_start + 1, len(self.lines)):
-                    if self.lines[i].startswith("# "):
-                        break
-                    if any(pattern.search(self.lines[i]) for pattern, _ in id_mappings.values()):
-                        insert_pos = i + 1
-                    elif self.lines[i].strip() == "":
-                        continue
-                    else:
-                        break
-
+            if id_name in existing:
+                # Update existing ID
+                line_idx = existing[id_name]
+                self._replace_line(line_idx, id_marker)
+                if any(pos == line_idx for name, pos in existing.items() if name != id_name):
+                    # The replaced line also held another ID; find that one again
+                    existing, insert_pos = self._scan_id_markers(section_start, id_mappings)
+            else:
+                # Insert new ID marker after any ID markers leading the section
                 self.lines.insert(insert_pos, id_marker)
-                setattr(task, id_name, id_value)
+                existing = {
+                    name: pos + 1 if pos >= insert_pos else pos
+                    for name, pos in existing.items()
+                }
+                existing[id_name] = insert_pos
+                insert_pos += 1
+            setattr(task, id_name, id_value)
+
+    def add_detail_sections(
+        self, entries: list[tuple[OrgplanTask, dict[str, str]]]
+    ) -> list[Optional[Exception]]:
+        """Add backend IDs to the detail sections of several tasks.
+
+        Existing sections are edited bottom-up, so inserting a marker never
+        shifts a section that is still to be edited and each lookup hits the
+        task's detail_line_number. Tasks without a section are handled last,
+        in the given order, since appending at the end moves nothing.
+
+        Args:
+            entries: (task, backend IDs) pairs, as passed to add_detail_section
+
+        Returns:
+            None or the raised exception for each entry, in the given order
+        """
+        # Stable sort: sectionless tasks (line 0) end up last, in their given order
+        order = sorted(range(len(entries)), key=lambda i: -entries[i][0].detail_line_number)
+        errors: list[Optional[Exception]] = [None] * len(entries)
+        for i in order:
+            task, backend_ids = entries[i]
+            try:
+                self.add_detail_section(task, **backend_ids)
+            except Exception as e:
+                errors[i] = e
+        return errors
+
+    def _scan_id_markers(
+        self, section_start: int, id_mappings: dict
+    ) -> tuple[dict[str, int], int]:
+        """Locate backend ID markers in a detail section with one pass.
+
+        Args:
+            section_start: Index of the section header in self.lines
+            id_mappings: ID name to (pattern, marker name) mapping
+
+        Returns:
+            Tuple of (ID name to index of its first marker line, index where a
+            new marker goes: after the ID markers and blank lines that open
+            the section)
+        """
+        existing = {}
+        insert_pos = section_start + 1
+        in_leading_run = True
+        for i in range(section_start + 1, len(self.lines)):
+            line = self.lines[i]
+            if line.startswith("# "):
+                break
+            is_marker = False
+            if "<!--" in line:  # Every ID marker is an HTML comment
+                for id_name, (pattern, _) in id_mappings.items():
+                    if pattern.search(line):
+                        existing.setdefault(id_name, i)
+                        is_marker = True
+            if in_leading_run:
+                if is_marker:
+                    insert_pos = i + 1
+                elif line.strip():
+                    in_leading_run = False
+        return existing, insert_pos
 
     def update_detail_section_body(self, task: OrgplanTask, body: str):
         """Add or replace body text in a task's detail section.
@@ -478,14 +790,7 @@ class OrgplanParser:
         if not self.lines:
             self.load()
 
-        section_header = f"# {task.description}"
-        section_start = -1
-
-        for i, line in enumerate(self.lines):
-            if line.strip() == section_header:
-                section_start = i
-                break
-
+        section_start = self._find_detail_header(task)
         if section_start == -1:
             return
 
@@ -498,43 +803,40 @@ class OrgplanParser:
 
         # Identify the last ID marker line so we can insert body after it
         last_marker_pos = section_start
-        id_patterns = [self.MS_TODO_ID_PATTERN, self.GOOGLE_TASKS_ID_PATTERN]
         for i in range(section_start + 1, section_end):
-            if any(p.search(self.lines[i]) for p in id_patterns):
+            if _ANY_ID_PATTERN.search(self.lines[i]):
                 last_marker_pos = i
 
-        # Remove old non-marker, non-blank content lines between markers and section end
+        # Replace existing body lines (everything from body_start to section_end)
+        # with the new body, in one slice assignment
         body_start = last_marker_pos + 1
-        # Remove existing body lines (everything from body_start to section_end)
-        del self.lines[body_start:section_end]
-
-        # Insert new body content
         body_lines = body.strip().split("\n")
-        for idx, bline in enumerate(body_lines):
-            self.lines.insert(body_start + idx, bline)
-        # Add blank line separator after markers if needed
-        if body_lines and last_marker_pos > section_start:
-            self.lines.insert(body_start, "")
+        if last_marker_pos > section_start:
+            # Add blank line separator after markers
+            body_lines.insert(0, "")
+        self._track_replaced_lines(self.lines[body_start:section_end], body_lines)
+        self.lines[body_start:section_end] = body_lines
+        self._lines_changed()
 
         # Update the in-memory detail_section
-        task.detail_section = self._rebuild_detail_section(task)
+        task.detail_section = self._rebuild_detail_section(task, section_start)
 
-    def _rebuild_detail_section(self, task: OrgplanTask) -> str:
-        """Re-read the detail section content from self.lines for a task."""
-        section_header = f"# {task.description}"
-        in_section = False
-        section_lines = []
+    def _rebuild_detail_section(
+        self, task: OrgplanTask, section_start: Optional[int] = None
+    ) -> str:
+        """Re-read the detail section content from self.lines for a task.
 
-        for line in self.lines:
-            if line.strip() == section_header:
-                in_section = True
-                continue
-            elif in_section:
-                if line.startswith("# "):
-                    break
-                section_lines.append(line)
+        Args:
+            task: Task whose detail section to read
+            section_start: Index of the section header, if the caller knows it
+        """
+        if section_start is None:
+            section_start = self._find_detail_header(task)
+            if section_start == -1:
+                return ""
 
-        return "\n".join(section_lines).strip()
+        section_header = f"# {task.description}"
+        return "\n".join(self._section_body_lines(section_header, section_start)).strip()
 
     def _parse_timestamps(
         self, text: str
@@ -545,45 +847,35 @@ class OrgplanParser:
         deadlines = []
         scheduled_list = []
         timestamps = []
-        prefixed_starts = set()
-
-        for match in re.finditer(r"DEADLINE:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)", text):
-            ts_match = self.TIMESTAMP_PATTERN.search(match.group(0))
-            if ts_match:
-                dt = self._extract_datetime(ts_match)
-                if dt:
-                    deadlines.append(dt)
-                    prefixed_starts.add(match.start() + ts_match.start())
-
-        for match in re.finditer(r"SCHEDULED:\s*(<\d{4}-\d{2}-\d{2}[^>]*>)", text):
-            ts_match = self.TIMESTAMP_PATTERN.search(match.group(0))
-            if ts_match:
-                dt = self._extract_datetime(ts_match)
-                if dt:
-                    scheduled_list.append(dt)
-                    prefixed_starts.add(match.start() + ts_match.start())
-
-        for match in self.TIMESTAMP_PATTERN.finditer(text):
-            if match.start() in prefixed_starts:
-                continue
-            dt = self._extract_datetime(match)
+        if "<" not in text:
+            return deadlines, scheduled_list, timestamps
+        by_keyword = {"DEADLINE": deadlines, "SCHEDULED": scheduled_list, None: timestamps}
+
+        for match in _DUE_TIMESTAMP_PATTERN.finditer(text):
+            # One groups() call instead of a lookup per named group
+            keyword, year, month, day, hour, minute = match.groups()
+            dt = self._extract_datetime(year, month, day, hour, minute)
             if dt:
-                timestamps.append(dt)
+                by_keyword[keyword].append(dt)
 
         return deadlines, scheduled_list, timestamps
 
-    def _extract_datetime(self, match) -> Optional[datetime.date | datetime.datetime]:
+    def _extract_datetime(
+        self,
+        year: str,
+        month: str,
+        day: str,
+        hour: Optional[str] = None,
+        minute: Optional[str] = None,
+    ) -> Optional[datetime.date | datetime.datetime]:
         try:
-            year = int(match.group("year"))
-            month = int(match.group("month"))
-            day = int(match.group("day"))
-            hour = match.group("hour")
-            minute = match.group("minute")
-
             if hour and minute:
-                return datetime.datetime(year, month, day, int(hour), int(minute))
-            return datetime.date(year, month, day)
-        except (ValueError, AttributeError):
+                return datetime.datetime(
+                    int(year), int(month), int(day), int(hour), int(minute)
+                )
+            return datetime.date(int(year), int(month), int(day))
+        except ValueError:
+            # Digits matched but not a real date/time (e.g. month 13)
             return None
 
     def _select_due_date(
@@ -612,46 +904,60 @@ class OrgplanParser:
         due_date = self._select_due_date(deadlines, scheduled, timestamps)
 
         due_marker_style = None
-        if self.DEADLINE_PATTERN.search(text):
-            due_marker_style = "deadline"
-        elif self.SCHEDULED_PATTERN.search(text):
-            due_marker_style = "scheduled"
-        elif self.TIMESTAMP_PATTERN.search(text):
-            due_marker_style = "plain"
+        # Every marker style is an <...> timestamp
+        if "<" in text:
+            if _DEADLINE_PATTERN.search(text):
+                due_marker_style = "deadline"
+            elif _SCHEDULED_PATTERN.search(text):
+                due_marker_style = "scheduled"
+            elif _TIMESTAMP_PATTERN.search(text):
+                due_marker_style = "plain"
 
         return due_date, due_marker_style
 
     def _strip_due_markers(self, text: str) -> str:
-        text = self.DEADLINE_PATTERN.sub("", text)
-        text = self.SCHEDULED_PATTERN.sub("", text)
-        text = self.TIMESTAMP_PATTERN.sub("", text)
-        return " ".join(text.split()).strip()
+        if "<" in text:
+            text = _DUE_MARKERS_PATTERN.sub("", text)
+        # split()/join() already drops leading and trailing whitespace
+        return " ".join(text.split())
 
     def _format_task_line(self, task: OrgplanTask) -> str:
-        parts = ["- "]
-
-        if task.status:
-            parts.append(f"[{task.status}] ")
-
-        if task.priority:
-            parts.append(f"#p{task.priority} ")
-
-        parts.append(task.description)
+        status_part = f"[{task.status}] " if task.status else ""
+        priority_part = f"#p{task.priority} " if task.priority else ""
 
+        due_part = ""
         if task.due_date and task.due_marker_style:
             due_text = task.due_date.isoformat()
             if task.due_marker_style == "deadline":
-                parts.append(f" DEADLINE: <{due_text}>")
+                due_part = f" DEADLINE: <{due_text}>"
             elif task.due_marker_style == "scheduled":
-                parts.append(f" SCHEDULED: <{due_text}>")
+                due_part = f" SCHEDULED: <{due_text}>"
             else:
-                parts.append(f" <{due_text}>")
+                due_part = f" <{due_text}>"
 
-        return "".join(parts).strip()
+        # The line always starts with "- ", so only the right end can need trimming
+        return f"- {status_part}{priority_part}{task.description}{due_part}".rstrip()
 
     def save(self):
-        """Save changes back to the orgplan file."""
+        """Save changes back to the orgplan file.
+
+        Nothing is written when the lines are unedited since load() and the
+        file has not changed on disk in the meantime.
+        """
+        if self._loaded_signature is not None:
+            st = self.file_path.stat()
+            if self._loaded_signature == (st.st_mtime_ns, st.st_size, st.st_ino):
+                return
+
+        OrgplanParser._file_cache.pop(self.file_path, None)
+        OrgplanParser._parsed_cache.pop(self.file_path, None)
         with open(self.file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(self.lines))
+            if self._content is not None or not self.lines:
+                f.write(self.content)
+            else:
+                # Nothing has asked for the joined text, so stream the lines
+                # through the file buffer instead of building it just to write
+                f.write(self.lines[0])
+                f.writelines("\n" + line for line in itertools.islice(self.lines, 1, None))
             if self.lines and not self.lines[-1].endswith("\n"):
                 f.write("\n")
@@ -241,10 +241,10 @@ def main():
     lock = SyncLock(lock_file, logger)
 
     if not lock.acquire(timeout=0, stale_threshold=3600):
-        logger.error("Failed to acquire lock. Another sync may be running.")
-        logger.error(f"If no other sync is running, remove: {lock_file}")
+        logger.error("Failed to acquire lock. Another sync is running.")
         sys.exit(1)
 
+    backend = None
     try:
         # Initialize backend
         backend_name = config.backend.title() + (
@@ -262,6 +262,7 @@ def main():
         task_list = backend.get_list_by_name(config.task_list_name)
 
         # For Google Tasks, use primary list if name not specified or not found
+        all_lists = None
         if not task_list and config.backend == "google" and not config.task_list_name:
             logger.info("No task list specified, using primary list...")
             all_lists = backend.get_task_lists()
@@ -269,9 +270,12 @@ def main():
 
         if not task_list:
             logger.error(f"Task list '{config.task_list_name}' not found")
-            logger.error("Available lists:")
-            for lst in backend.get_task_lists():
-                logger.error(f"  - {lst.get('displayName') or lst.get('title')}")
+            if all_lists is None:
+                all_lists = backend.get_task_lists()
+            available = "\n".join(
+                f"  - {lst.get('displayName') or lst.get('title')}" for lst in all_lists
+            )
+            logger.error(f"Available lists:\n{available}")
             sys.exit(1)
 
         list_name = task_list.get("displayName") or task_list.get("title")
@@ -376,6 +380,8 @@ def main():
         logger.error(f"Sync failed: {e}", exc_info=args.verbose)
         sys.exit(1)
     finally:
+        if backend is not None:
+            backend.close()
         # Always release the lock
         lock.release()
 
@@ -1,12 +1,23 @@
 """Sync engine for orgplan and task backends."""
 
 import logging
-import re
+from dataclasses import replace
+from operator import attrgetter
 from typing import Optional
 
 from backends.base import TaskBackend, TaskItem
 from orgplan_parser import OrgplanParser, OrgplanTask
 
+# Orgplan priority -> backend importance; priorities 3+ map to "low"
+_PRIORITY_TO_IMPORTANCE = {None: "normal", 1: "high", 2: "normal"}
+_IMPORTANCE_TO_PRIORITY = {"high": 1, "normal": 2, "low": 3}
+# Orgplan states that count as completed in the backend
+_COMPLETED_STATUSES = frozenset({"DONE", "DELEGATED", "CANCELED"})
+# Any backend ID marker, as one compiled alternation (one search per line)
+_ID_MARKER_PATTERN = OrgplanParser.ANY_ID_PATTERN
+# Every ID marker is an HTML comment; lines without one skip the regex
+_ID_MARKER_OPEN = "<!--"
+
 
 class SyncEngine:
     """Coordinates synchronization between orgplan and task backend."""
@@ -32,11 +43,61 @@ class SyncEngine:
         self.dry_run = dry_run
         self.logger = logging.getLogger(__name__)
 
-        # Patterns used to strip backend ID markers from detail sections
-        self._id_marker_patterns = [
-            OrgplanParser.MS_TODO_ID_PATTERN,
-            OrgplanParser.GOOGLE_TASKS_ID_PATTERN,
-        ]
+        # OrgplanTask attribute holding this backend's ID (e.g. ms_todo_id)
+        self._backend_id_attr = backend.id_marker_prefix.replace("-", "_")
+        # Reads that attribute; a C-level getter instead of getattr(task, name, None)
+        self._get_backend_id = attrgetter(self._backend_id_attr)
+        # Capability flags are fixed per backend; read them once, not per task
+        self._supports_priority = backend.supports_priority
+
+        # Notes extracted per detail section text; both sync phases look at
+        # the same sections, and a changed section is a different key
+        self._notes_cache: dict[str, Optional[str]] = {}
+
+        # Backend tasks indexed by ID and by title, fetched once per sync run
+        self._todo_index: Optional[tuple[dict[str, TaskItem], dict[str, TaskItem]]] = None
+
+    def _get_todo_index(self) -> tuple[dict[str, TaskItem], dict[str, TaskItem]]:
+        """Return backend tasks indexed by ID and by title, fetching them once.
+
+        Returns:
+            Tuple of (tasks by ID, tasks by title)
+        """
+        if self._todo_index is None:
+            self.logger.info("Loading To Do tasks...")
+            todo_tasks = self.backend.get_tasks(self.task_list_id)
+            self.logger.info("Found %d tasks in To Do", len(todo_tasks))
+
+            # One pass fills both maps; tasks without an ID can only match by title
+            todo_by_id = {}
+            todo_by_title = {}
+            for task in todo_tasks:
+                if task.id:
+                    todo_by_id[task.id] = task
+                todo_by_title[task.title] = task
+            self._todo_index = (todo_by_id, todo_by_title)
+
+        return self._todo_index
+
+    def invalidate_todo_index(self):
+        """Drop the cached backend task index so the next lookup refetches it."""
+        self._todo_index = None
+
+    def _index_todo_task(self, task: TaskItem, previous: Optional[TaskItem] = None):
+        """Record a created or updated backend task in the cached index.
+
+        Args:
+            task: Task as returned by the backend
+            previous: Task it replaces, if any
+        """
+        if self._todo_index is None:
+            return
+
+        todo_by_id, todo_by_title = self._todo_index
+        if previous is not None and todo_by_title.get(previous.title) is previous:
+            del todo_by_title[previous.title]
+        todo_by_id[task.id] = task
+        todo_by_title[task.title] = task
 
     def _extract_notes_from_detail_section(self, detail_section: str) -> Optional[str]:
         """Extract plain notes text from a detail section, stripping backend ID markers.
@@ -47,22 +108,33 @@ class SyncEngine:
         Returns:
             Clean notes text, or None if no meaningful content exists
         """
-        if not detail_section or not detail_section.strip():
+        if not detail_section:
             return None
-
-        lines = detail_section.split("\n")
-        notes_lines = []
-        for line in lines:
-            if any(p.search(line) for p in self._id_marker_patterns):
-                continue
-            notes_lines.append(line)
-
-        notes = "\n".join(notes_lines).strip()
-        return notes if notes else None
-
-    def sync_orgplan_to_todo(self) -> dict:
+        if detail_section in self._notes_cache:
+            return self._notes_cache[detail_section]
+
+        has_marker = _ID_MARKER_PATTERN.search
+        notes = "\n".join(
+            [
+                line
+                for line in detail_section.split("\n")
+                if _ID_MARKER_OPEN not in line or not has_marker(line)
+            ]
+        ).strip()
+        notes = notes if notes else None
+        self._notes_cache[detail_section] = notes
+        return notes
+
+    def sync_orgplan_to_todo(
+        self, save: bool = True, orgplan_tasks: Optional[list[OrgplanTask]] = None
+    ) -> dict:
         """Sync tasks from orgplan to Microsoft To Do (Phase 1 MVP).
 
+        Args:
+            save: Write orgplan changes when done; callers that run more
+                phases afterwards pass False and save once at the end
+            orgplan_tasks: Tasks already parsed by the caller; parsed here if None
+
         Returns:
             Dictionary with sync statistics
         """
@@ -74,199 +146,244 @@ class SyncEngine:
         }
 
         # Load orgplan tasks
-        self.logger.info("Loading orgplan tasks...")
-        orgplan_tasks = self.orgplan_parser.parse_tasks()
-        self.logger.info(f"Found {len(orgplan_tasks)} tasks in orgplan")
+        if orgplan_tasks is None:
+            self.logger.info("Loading orgplan tasks...")
+            orgplan_tasks = self.orgplan_parser.parse_tasks()
+            self.logger.info("Found %d tasks in orgplan", len(orgplan_tasks))
 
-        # Load To Do tasks
-        self.logger.info("Loading To Do tasks...")
-        todo_tasks = self.backend.get_tasks(self.task_list_id)
-        self.logger.info(f"Found {len(todo_tasks)} tasks in To Do")
+        # Load To Do tasks and lookup maps
+        todo_by_id, todo_by_title = self._get_todo_index()
 
-        # Build lookup maps
-        todo_by_id = {task.id: task for task in todo_tasks}
-        todo_by_title = {task.title: task for task in todo_tasks}
+        # Writes are queued as (orgplan task, backend task) pairs and sent in batches
+        creates = []
+        updates = []
+
+        get_backend_id = self._get_backend_id
+        get_by_id = todo_by_id.get
+        get_by_title = todo_by_title.get
 
         # Process each orgplan task
         for orgplan_task in orgplan_tasks:
             try:
-                # Find matching To Do task
-                todo_task = self._find_matching_todo_task(orgplan_task, todo_by_id, todo_by_title)
+                # Find matching To Do task: by backend ID first, then by title
+                backend_id = get_backend_id(orgplan_task)
+                todo_task = (backend_id and get_by_id(backend_id)) or get_by_title(
+                    orgplan_task.description
+                )
 
                 if todo_task:
                     # Update existing task
-                    if self._update_todo_task(orgplan_task, todo_task):
+                    updated_task = self._update_todo_task(orgplan_task, todo_task)
+                    if updated_task is None:
+                        stats["skipped"] += 1
+                    elif self.dry_run:
                         stats["updated"] += 1
                     else:
-                        stats["skipped"] += 1
+                        updates.append((orgplan_task, updated_task))
                 else:
                     # Create new task
-                    if self._create_todo_task(orgplan_task):
+                    new_task = self._create_todo_task(orgplan_task)
+                    if self.dry_run:
                         stats["created"] += 1
+                    else:
+                        creates.append((orgplan_task, new_task))
 
             except Exception as e:
-                self.logger.error(f"Error processing task '{orgplan_task.description}': {e}")
+                self.logger.error("Error processing task '%s': %s", orgplan_task.description, e)
                 stats["errors"] += 1
 
+        if creates:
+            self._apply_todo_creates(creates, stats)
+        if updates:
+            self._apply_todo_updates(updates, stats)
+
         # Save orgplan changes if not dry run
-        if not self.dry_run:
+        if save and not self.dry_run:
             self.orgplan_parser.save()
             self.logger.info("Saved orgplan changes")
 
         return stats
 
-    def _find_matching_todo_task(
-        self,
-        orgplan_task: OrgplanTask,
-        todo_by_id: dict[str, TaskItem],
-        todo_by_title: dict[str, TaskItem],
-    ) -> Optional[TaskItem]:
-        """Find matching backend task for an orgplan task.
-
-        Args:
-            orgplan_task: Orgplan task to match
-            todo_by_id: Dictionary of backend tasks by ID
-            todo_by_title: Dictionary of backend tasks by title
-
-        Returns:
-            Matching TaskItem or None
-        """
-        # Try matching by backend-specific ID first
-        backend_id_attr = self.backend.id_marker_prefix.replace("-", "_")
-        backend_id = getattr(orgplan_task, backend_id_attr, None)
-
-        if backend_id and backend_id in todo_by_id:
-            return todo_by_id[backend_id]
-
-        # Fallback to title matching
-        if orgplan_task.description in todo_by_title:
-            return todo_by_title[orgplan_task.description]
-
-        return None
-
-    def _create_todo_task(self, orgplan_task: OrgplanTask) -> bool:
-        """Create a new To Do task from orgplan task.
+    def _create_todo_task(self, orgplan_task: OrgplanTask) -> TaskItem:
+        """Build a new To Do task from orgplan task.
 
         Args:
             orgplan_task: Orgplan task to create
 
         Returns:
-            True if task was created
+            TaskItem to send to the backend
         """
         importance = self._map_priority_to_importance(orgplan_task.priority)
         title = orgplan_task.description
 
-        self.logger.info(f"Creating task: {title}")
+        self.logger.info("Creating task: %s", title)
 
         if self.dry_run:
-            self.logger.info(f"  [DRY RUN] Would create task with importance={importance}")
-            return True
-
-        try:
-            # Create TaskItem for new task
-            notes = self._extract_notes_from_detail_section(orgplan_task.detail_section)
-            task_item = TaskItem(
-                id="",  # Will be assigned by backend
-                title=title,
-                status="active",
-                importance=importance,
-                body=notes,
-                due_date=orgplan_task.due_date,
-            )
-
-            created_task = self.backend.create_task(self.task_list_id, task_item)
-
-            # Add backend ID to orgplan
-            id_marker = {f"{self.backend.id_marker_prefix.replace('-', '_')}": created_task.id}
-            self.orgplan_parser.add_detail_section(orgplan_task, **id_marker)
-
-            self.logger.info(f"  Created task with ID: {created_task.id}")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"  Failed to create task: {e}")
-            return False
+            self.logger.info("  [DRY RUN] Would create task with importance=%s", importance)
+
+        notes = self._extract_notes_from_detail_section(orgplan_task.detail_section)
+        return TaskItem(
+            id="",  # Will be assigned by backend
+            title=title,
+            status="active",
+            importance=importance,
+            body=notes,
+            due_date=orgplan_task.due_date,
+        )
 
-    def _update_todo_task(self, orgplan_task: OrgplanTask, todo_task: TaskItem) -> bool:
-        """Update existing To Do task from orgplan task.
+    def _update_todo_task(
+        self, orgplan_task: OrgplanTask, todo_task: TaskItem
+    ) -> Optional[TaskItem]:
+        """Build the update for an existing To Do task from orgplan task.
 
         Args:
             orgplan_task: Orgplan task (source)
             todo_task: To Do task (target)
 
         Returns:
-            True if task was updated
+            Updated TaskItem to send to the backend, or None if up to date
         """
+        # Desired field values; importance and due date are only synced when
+        # the backend supports priority / orgplan has a date, so keep the
+        # remote values otherwise
+        desired_status = self._map_orgplan_status_to_todo(orgplan_task.status)
+        desired_importance = (
+            self._map_priority_to_importance(orgplan_task.priority)
+            if self._supports_priority
+            else todo_task.importance
+        )
+        desired_due_date = orgplan_task.due_date or todo_task.due_date
+        orgplan_notes = self._extract_notes_from_detail_section(orgplan_task.detail_section)
+        remote_body = todo_task.body.strip() or None if todo_task.body else None
+
+        current = (
+            todo_task.title,
+            todo_task.status,
+            todo_task.importance,
+            todo_task.due_date,
+            remote_body,
+        )
+        desired = (
+            orgplan_task.description,
+            desired_status,
+            desired_importance,
+            desired_due_date,
+            orgplan_notes,
+        )
+        if current == desired:
+            self.logger.debug("Task '%s' is up to date", orgplan_task.description)
+            return None
+
         updates = {}
         changes = []
-
-        # Check title
         if orgplan_task.description != todo_task.title:
             updates["title"] = orgplan_task.description
             changes.append(f"title: '{todo_task.title}' -> '{orgplan_task.description}'")
-
-        # Check status
-        desired_status = self._map_orgplan_status_to_todo(orgplan_task.status)
         if desired_status != todo_task.status:
             updates["status"] = desired_status
             changes.append(f"status: {todo_task.status} -> {desired_status}")
-
-        # Check importance (only if backend supports priority)
-        if self.backend.supports_priority:
-            desired_importance = self._map_priority_to_importance(orgplan_task.priority)
-            if desired_importance != todo_task.importance:
-                updates["importance"] = desired_importance
-                changes.append(f"importance: {todo_task.importance} -> {desired_importance}")
-
-        # Check due date (only if orgplan has one set)
-        if orgplan_task.due_date and orgplan_task.due_date != todo_task.due_date:
-            updates["due_date"] = orgplan_task.due_date
-            changes.append(f"due_date: {todo_task.due_date} -> {orgplan_task.due_date}")
-
-        # Check notes/body
-        orgplan_notes = self._extract_notes_from_detail_section(orgplan_task.detail_section)
-        remote_body = todo_task.body.strip() if todo_task.body else None
-        if (orgplan_notes or remote_body) and orgplan_notes != remote_body:
+        if desired_importance != todo_task.importance:
+            updates["importance"] = desired_importance
+            changes.append(f"importance: {todo_task.importance} -> {desired_importance}")
+        if desired_due_date != todo_task.due_date:
+            updates["due_date"] = desired_due_date
+            changes.append(f"due_date: {todo_task.due_date} -> {desired_due_date}")
+        if orgplan_notes != remote_body:
             updates["body"] = orgplan_notes
             changes.append(f"body: '{remote_body or ''}' -> '{orgplan_notes or ''}'")
 
-        if not updates:
-            self.logger.debug(f"Task '{orgplan_task.description}' is up to date")
-            return False
-
-        self.logger.info(f"Updating task: {orgplan_task.description}")
+        self.logger.info("Updating task: %s", orgplan_task.description)
         for change in changes:
-            self.logger.info(f"  {change}")
+            self.logger.info("  %s", change)
 
         if self.dry_run:
             self.logger.info("  [DRY RUN] Would update task")
-            return True
 
-        try:
-            # Create updated TaskItem
-            updated_task = TaskItem(
-                id=todo_task.id,
-                title=updates.get("title", todo_task.title),
-                status=updates.get("status", todo_task.status),
-                importance=updates.get("importance", todo_task.importance),
-                body=updates.get("body", todo_task.body),
-                due_date=updates.get("due_date", todo_task.due_date),
+        return replace(todo_task, **updates)
+
+    def _apply_todo_creates(self, creates: list[tuple[OrgplanTask, TaskItem]], stats: dict):
+        """Create queued tasks in the backend and record their IDs in orgplan.
+
+        Args:
+            creates: (orgplan task, TaskItem to create) pairs
+            stats: Sync statistics to update
+        """
+        backend_id_attr = self._backend_id_attr
+        results = self.backend.create_tasks(self.task_list_id, [item for _, item in creates])
+
+        created = []
+        for (orgplan_task, _), result in zip(creates, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "  Failed to create task '%s': %s", orgplan_task.description, result
+                )
+                # The remote list may have changed anyway (e.g. a timeout after the write)
+                self.invalidate_todo_index()
+                continue
+            created.append((orgplan_task, result))
+
+        # Add backend IDs to orgplan in one parser pass
+        errors = self.orgplan_parser.add_detail_sections(
+            [(orgplan_task, {backend_id_attr: result.id}) for orgplan_task, result in created]
+        )
+
+        for (orgplan_task, result), error in zip(created, errors):
+            if error is not None:
+                self.logger.error(
+                    "  Failed to create task '%s': %s", orgplan_task.description, error
+                )
+                continue
+
+            self._index_todo_task(result)
+            self.logger.info(
+                "  Created task '%s' with ID: %s", orgplan_task.description, result.id
             )
+            stats["created"] += 1
 
-            self.backend.update_task(self.task_list_id, updated_task)
+    def _apply_todo_updates(self, updates: list[tuple[OrgplanTask, TaskItem]], stats: dict):
+        """Send queued task updates to the backend.
 
-            # Ensure backend ID is in orgplan
-            backend_id_attr = self.backend.id_marker_prefix.replace("-", "_")
-            if not getattr(orgplan_task, backend_id_attr, None):
-                id_marker = {backend_id_attr: todo_task.id}
-                self.orgplan_parser.add_detail_section(orgplan_task, **id_marker)
+        Args:
+            updates: (orgplan task, updated TaskItem) pairs
+            stats: Sync statistics to update
+        """
+        backend_id_attr = self._backend_id_attr
+        results = self.backend.update_tasks(self.task_list_id, [item for _, item in updates])
+        # Previous task versions, to drop their stale titles from the index
+        todo_by_id = self._todo_index[0] if self._todo_index else {}
+
+        updated = []
+        missing_ids = []
+        for (orgplan_task, updated_task), result in zip(updates, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "  Failed to update task '%s': %s", orgplan_task.description, result
+                )
+                stats["skipped"] += 1
+                self.invalidate_todo_index()
+                continue
 
-            self.logger.info("  Updated successfully")
-            return True
+            # Ensure backend ID is in orgplan
+            needs_id = not self._get_backend_id(orgplan_task)
+            if needs_id:
+                missing_ids.append((orgplan_task, {backend_id_attr: updated_task.id}))
+            updated.append((orgplan_task, updated_task, result, needs_id))
+
+        # Add the missing backend IDs to orgplan in one parser pass
+        errors = iter(self.orgplan_parser.add_detail_sections(missing_ids))
+
+        for orgplan_task, updated_task, result, needs_id in updated:
+            error = next(errors) if needs_id else None
+            if error is not None:
+                self.logger.error(
+                    "  Failed to update task '%s': %s", orgplan_task.description, error
+                )
+                stats["skipped"] += 1
+                continue
 
-        except Exception as e:
-            self.logger.error(f"  Failed to update task: {e}")
-            return False
+            self._index_todo_task(result, todo_by_id.get(updated_task.id))
+            self.logger.info("  Updated '%s' successfully", orgplan_task.description)
+            stats["updated"] += 1
 
     def _map_priority_to_importance(self, priority: Optional[int]) -> str:
         """Map orgplan priority to To Do importance.
@@ -277,14 +394,7 @@ class SyncEngine:
         Returns:
             To Do importance (low, normal, high)
         """
-        if priority is None:
-            return "normal"
-        elif priority == 1:
-            return "high"
-        elif priority == 2:
-            return "normal"
-        else:  # 3+
-            return "low"
+        return _PRIORITY_TO_IMPORTANCE.get(priority, "low")
 
     def _map_orgplan_status_to_todo(self, status: Optional[str]) -> str:
         """Map orgplan status to backend task status.
@@ -295,10 +405,7 @@ class SyncEngine:
         Returns:
             Backend status (active, completed)
         """
-        if status in ["DONE", "DELEGATED", "CANCELED"]:
-            return "completed"
-        else:
-            return "active"
+        return "completed" if status in _COMPLETED_STATUSES else "active"
 
     def sync_todo_to_orgplan(
         self, orgplan_tasks: list[OrgplanTask], todo_tasks: list[TaskItem]
@@ -319,16 +426,17 @@ class SyncEngine:
             "errors": 0,
         }
 
-        # Build lookup maps for orgplan tasks
-        orgplan_by_id = {}
-        orgplan_by_title = {}
-        backend_id_attr = self.backend.id_marker_prefix.replace("-", "_")
+        # Build lookup maps for orgplan tasks; tasks without an ID match by title only
+        get_backend_id = self._get_backend_id
+        orgplan_by_id = {
+            backend_id: task
+            for task in orgplan_tasks
+            if (backend_id := get_backend_id(task))
+        }
+        orgplan_by_title = {task.description: task for task in orgplan_tasks}
 
-        for task in orgplan_tasks:
-            backend_id = getattr(task, backend_id_attr, None)
-            if backend_id:
-                orgplan_by_id[backend_id] = task
-            orgplan_by_title[task.description] = task
+        get_by_id = orgplan_by_id.get
+        get_by_title = orgplan_by_title.get
 
         # Process each To Do task
         for todo_task in todo_tasks:
@@ -337,15 +445,13 @@ class SyncEngine:
                 # (they were likely completed in a previous month)
                 if todo_task.is_completed and todo_task.id not in orgplan_by_id:
                     self.logger.debug(
-                        f"Skipping completed To Do task not in orgplan: {todo_task.title}"
+                        "Skipping completed To Do task not in orgplan: %s", todo_task.title
                     )
                     stats["skipped"] += 1
                     continue
 
-                # Find matching orgplan task
-                orgplan_task = self._find_matching_orgplan_task(
-                    todo_task, orgplan_by_id, orgplan_by_title
-                )
+                # Find matching orgplan task: by ID first, then by title
+                orgplan_task = get_by_id(todo_task.id) or get_by_title(todo_task.title)
 
                 if orgplan_task:
                     # Update existing task
@@ -359,37 +465,11 @@ class SyncEngine:
                         stats["created"] += 1
 
             except Exception as e:
-                self.logger.error(f"Error processing To Do task '{todo_task.title}': {e}")
+                self.logger.error("Error processing To Do task '%s': %s", todo_task.title, e)
                 stats["errors"] += 1
 
         return stats
 
-    def _find_matching_orgplan_task(
-        self,
-        todo_task: TaskItem,
-        orgplan_by_id: dict[str, OrgplanTask],
-        orgplan_by_title: dict[str, OrgplanTask],
-    ) -> Optional[OrgplanTask]:
-        """Find matching orgplan task for a To Do task.
-
-        Args:
-            todo_task: To Do task to match
-            orgplan_by_id: Dictionary of orgplan tasks by ms-todo-id
-            orgplan_by_title: Dictionary of orgplan tasks by description
-
-        Returns:
-            Matching OrgplanTask or None
-        """
-        # Try matching by ID first
-        if todo_task.id in orgplan_by_id:
-            return orgplan_by_id[todo_task.id]
-
-        # Fallback to title matching
-        if todo_task.title in orgplan_by_title:
-            return orgplan_by_title[todo_task.title]
-
-        return None
-
     def _create_orgplan_task(self, todo_task: TaskItem) -> bool:
         """Create a new orgplan task from To Do task.
 
@@ -403,15 +483,15 @@ class SyncEngine:
         # Only map priority if backend supports it
         priority = (
             self._map_importance_to_priority(todo_task.importance)
-            if self.backend.supports_priority
+            if self._supports_priority
             else None
         )
 
-        self.logger.info(f"Creating orgplan task: {todo_task.title}")
+        self.logger.info("Creating orgplan task: %s", todo_task.title)
 
         if self.dry_run:
             self.logger.info(
-                f"  [DRY RUN] Would create task with status={status}, priority={priority}"
+                "  [DRY RUN] Would create task with status=%s, priority=%s", status, priority
             )
             return True
 
@@ -426,21 +506,20 @@ class SyncEngine:
             )
 
             # Add detail section with backend-specific ID
-            backend_id_attr = self.backend.id_marker_prefix.replace("-", "_")
+            backend_id_attr = self._backend_id_attr
             id_kwargs = {backend_id_attr: todo_task.id}
             self.orgplan_parser.add_detail_section(orgplan_task, **id_kwargs)
 
             # Add body to detail section if present and not empty
-            if todo_task.body and todo_task.body.strip():
-                self.orgplan_parser.update_detail_section_body(
-                    orgplan_task, todo_task.body.strip()
-                )
+            body = todo_task.body.strip() if todo_task.body else ""
+            if body:
+                self.orgplan_parser.update_detail_section_body(orgplan_task, body)
 
-            self.logger.info(f"  Created orgplan task")
+            self.logger.info("  Created orgplan task")
             return True
 
         except Exception as e:
-            self.logger.error(f"  Failed to create orgplan task: {e}")
+            self.logger.error("  Failed to create orgplan task: %s", e)
             return False
 
     def _update_orgplan_task(self, orgplan_task: OrgplanTask, todo_task: TaskItem) -> bool:
@@ -453,78 +532,89 @@ class SyncEngine:
         Returns:
             True if task was updated
         """
+        # Desired field values, falling back to the local value for fields
+        # that are not synced in this case
+        desired_status = self._map_todo_status_to_orgplan(todo_task.status)
+        # Special handling for CANCELED tasks:
+        # If local is CANCELED and remote is DONE, preserve local CANCELED.
+        # This is because most backends don't have a CANCELED state and treat it as completed.
+        if orgplan_task.status in ("CANCELED", "DELEGATED") and desired_status == "DONE":
+            desired_status = orgplan_task.status
+        desired_priority = (
+            self._map_importance_to_priority(todo_task.importance)
+            if self._supports_priority
+            else orgplan_task.priority
+        )
+        # Prefer title marker unless detail already has a deadline marker
+        desired_due_date = (
+            todo_task.due_date
+            if todo_task.due_date and not orgplan_task.detail_has_deadline_marker
+            else orgplan_task.due_date
+        )
+        # Backend notes only fill a detail section that has no notes content
+        remote_notes = todo_task.body.strip() if todo_task.body else None
+        adds_notes = bool(remote_notes) and not self._extract_notes_from_detail_section(
+            orgplan_task.detail_section
+        )
+
+        current = (
+            orgplan_task.description,
+            orgplan_task.status,
+            orgplan_task.priority,
+            orgplan_task.due_date,
+        )
+        desired = (todo_task.title, desired_status, desired_priority, desired_due_date)
+        if not adds_notes and current == desired:
+            self.logger.debug("Orgplan task '%s' is up to date", orgplan_task.description)
+            return False
+
         changes = []
         modified = False
+        backend_id_attr = self._backend_id_attr
 
-        # Check title
         if todo_task.title != orgplan_task.description:
             changes.append(f"title: '{orgplan_task.description}' -> '{todo_task.title}'")
             if not self.dry_run:
                 self.orgplan_parser.update_task_description(orgplan_task, todo_task.title)
                 modified = True
 
-        # Check status
-        desired_status = self._map_todo_status_to_orgplan(todo_task.status)
-
-        # Special handling for CANCELED tasks:
-        # If local is CANCELED and remote is DONE, preserve local CANCELED.
-        # This is because most backends don't have a CANCELED state and treat it as completed.
-        if (orgplan_task.status == "CANCELED" or orgplan_task.status == "DELEGATED") and desired_status == "DONE":
-            pass
-        elif desired_status != orgplan_task.status:
+        if desired_status != orgplan_task.status:
             changes.append(f"status: {orgplan_task.status} -> {desired_status}")
             if not self.dry_run:
                 self.orgplan_parser.update_task_status(orgplan_task, desired_status)
                 modified = True
 
-        # Check priority (only if backend supports it)
-        if self.backend.supports_priority:
-            desired_priority = self._map_importance_to_priority(todo_task.importance)
-            if desired_priority != orgplan_task.priority:
-                changes.append(f"priority: {orgplan_task.priority} -> {desired_priority}")
-                if not self.dry_run:
-                    self.orgplan_parser.update_task_priority(orgplan_task, desired_priority)
-                modified = True
-
-        # Check due date (prefer title marker unless detail already has a deadline marker)
-        if todo_task.due_date and todo_task.due_date != orgplan_task.due_date:
-            if not orgplan_task.detail_has_deadline_marker:
-                changes.append(f"due_date: {orgplan_task.due_date} -> {todo_task.due_date}")
-                if not self.dry_run:
-                    self.orgplan_parser.update_task_due_date(
-                        orgplan_task, todo_task.due_date, "plain"
-                    )
-                modified = True
+        if desired_priority != orgplan_task.priority:
+            changes.append(f"priority: {orgplan_task.priority} -> {desired_priority}")
+            if not self.dry_run:
+                self.orgplan_parser.update_task_priority(orgplan_task, desired_priority)
+            modified = True
 
-        # Sync detail section body (only if orgplan detail section has no notes content)
-        backend_id_attr = self.backend.id_marker_prefix.replace("-", "_")
-        orgplan_notes = self._extract_notes_from_detail_section(orgplan_task.detail_section)
+        if desired_due_date != orgplan_task.due_date:
+            changes.append(f"due_date: {orgplan_task.due_date} -> {desired_due_date}")
+            if not self.dry_run:
+                self.orgplan_parser.update_task_due_date(orgplan_task, desired_due_date, "plain")
+            modified = True
 
-        if todo_task.body and todo_task.body.strip() and not orgplan_notes:
+        if adds_notes:
             changes.append("adding backend notes to detail section")
             if not self.dry_run:
-                if not getattr(orgplan_task, backend_id_attr, None):
+                if not self._get_backend_id(orgplan_task):
                     id_kwargs = {backend_id_attr: todo_task.id}
                     self.orgplan_parser.add_detail_section(orgplan_task, **id_kwargs)
-                self.orgplan_parser.update_detail_section_body(
-                    orgplan_task, todo_task.body.strip()
-                )
+                self.orgplan_parser.update_detail_section_body(orgplan_task, remote_notes)
                 modified = True
 
-        if not changes:
-            self.logger.debug(f"Orgplan task '{orgplan_task.description}' is up to date")
-            return False
-
-        self.logger.info(f"Updating orgplan task: {orgplan_task.description}")
+        self.logger.info("Updating orgplan task: %s", orgplan_task.description)
         for change in changes:
-            self.logger.info(f"  {change}")
+            self.logger.info("  %s", change)
 
         if self.dry_run:
             self.logger.info("  [DRY RUN] Would update orgplan task")
             return True
 
         # Ensure backend ID is present
-        if not getattr(orgplan_task, backend_id_attr, None):
+        if not self._get_backend_id(orgplan_task):
             id_kwargs = {backend_id_attr: todo_task.id}
             self.orgplan_parser.add_detail_section(orgplan_task, **id_kwargs)
 
@@ -540,14 +630,7 @@ class SyncEngine:
         Returns:
             Orgplan priority (1, 2, 3) or None
         """
-        if importance == "high":
-            return 1
-        elif importance == "normal":
-            return 2
-        elif importance == "low":
-            return 3
-        else:
-            return None
+        return _IMPORTANCE_TO_PRIORITY.get(importance)
 
     def _map_todo_status_to_orgplan(self, status: str) -> Optional[str]:
         """Map backend task status to orgplan status.
@@ -558,12 +641,8 @@ class SyncEngine:
         Returns:
             Orgplan status (DONE, PENDING, or None)
         """
-        if status == "completed":
-            return "DONE"
-        elif status == "active":
-            return None  # Active tasks don't need a status marker
-        else:
-            return None
+        # Active tasks don't need a status marker
+        return "DONE" if status == "completed" else None
 
     def sync_bidirectional(self) -> dict:
         """Perform bidirectional sync between orgplan and To Do (Phase 2).
@@ -577,19 +656,20 @@ class SyncEngine:
 
         # Load tasks once
         orgplan_tasks = self.orgplan_parser.parse_tasks()
-        self.logger.info(f"Found {len(orgplan_tasks)} tasks in orgplan")
+        self.logger.info("Found %d tasks in orgplan", len(orgplan_tasks))
 
-        todo_tasks = self.backend.get_tasks(self.task_list_id)
-        self.logger.info(f"Found {len(todo_tasks)} tasks in To Do")
+        self._get_todo_index()
 
         # Phase 1: Orgplan -> To Do
-        stats_to_todo = self.sync_orgplan_to_todo()
+        stats_to_todo = self.sync_orgplan_to_todo(save=False, orgplan_tasks=orgplan_tasks)
 
-        # Reload tasks after Phase 1 changes
+        # Reload tasks after Phase 1 changes. Successful writes were applied to
+        # the cached backend index, which is only refetched if a write failed.
         if stats_to_todo["created"] > 0 or stats_to_todo["updated"] > 0:
             self.logger.info("Reloading tasks after orgplan -> To Do sync...")
             orgplan_tasks = self.orgplan_parser.parse_tasks()
-            todo_tasks = self.backend.get_tasks(self.task_list_id)
+
+        todo_tasks = list(self._get_todo_index()[0].values())
 
         self.logger.info("")
         self.logger.info("=" * 60)
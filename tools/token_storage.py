@@ -2,6 +2,8 @@
 
 import json
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional
 import logging
@@ -10,14 +12,22 @@ import logging
 class TokenStorage:
     """Manages storage and retrieval of OAuth tokens."""
 
+    # Access tokens this close to expiry are treated as expired, so a sync
+    # never starts with a token that runs out halfway through
+    EXPIRY_MARGIN = 300
+
     def __init__(
-        self, storage_path: Optional[Path] = None, logger: Optional[logging.Logger] = None
+        self,
+        storage_path: Optional[Path] = None,
+        logger: Optional[logging.Logger] = None,
+        filename: str = "tokens.json",
     ):
         """Initialize token storage.
 
         Args:
             storage_path: Path to token storage directory (default: .tokens/ in orgplan dir)
             logger: Optional logger
+            filename: Name of the token file within the storage directory
         """
         self.logger = logger or logging.getLogger(__name__)
 
@@ -26,7 +36,13 @@ class TokenStorage:
             storage_path = Path.cwd() / ".tokens"
 
         self.storage_path = storage_path
-        self.token_file = self.storage_path / "tokens.json"
+        self.token_file = self.storage_path / filename
+        # Token data as last read or written; the file is only read once per run
+        self._cached: Optional[dict] = None
+        # Expiry of the cached access token on the monotonic clock, so clock
+        # changes during a run neither expire nor extend it; the wall-clock
+        # expires_at is only used to carry the expiry between runs
+        self._expires_monotonic: Optional[float] = None
 
         # Ensure storage directory exists with secure permissions
         self._ensure_storage_directory()
@@ -56,8 +72,6 @@ class TokenStorage:
             refresh_token: OAuth refresh token (optional)
             expires_in: Token expiry time in seconds (optional)
         """
-        import time
-
         token_data = {
             "access_token": access_token,
             "refresh_token": refresh_token,
@@ -65,13 +79,21 @@ class TokenStorage:
         }
 
         try:
-            # Write with secure permissions
-            with open(self.token_file, "w") as f:
-                json.dump(token_data, f, indent=2)
-
-            # Ensure file has secure permissions (owner read/write only)
-            os.chmod(self.token_file, 0o600)
+            # Write a private (0600) temp file and rename it over the token
+            # file, so a concurrent reader or writer never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.storage_path, prefix=f"{self.token_file.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(token_data, f, indent=2)
+                os.replace(tmp_path, self.token_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
 
+            self._cached = token_data
+            self._expires_monotonic = time.monotonic() + expires_in if expires_in else None
             self.logger.debug(f"Saved tokens to {self.token_file}")
         except OSError as e:
             self.logger.error(f"Failed to save tokens: {e}")
@@ -80,9 +102,15 @@ class TokenStorage:
     def load_tokens(self) -> Optional[dict]:
         """Load tokens from storage.
 
+        The file is read on first use; later calls reuse the data this
+        instance last read or wrote.
+
         Returns:
             Dictionary with token data or None if no tokens exist
         """
+        if self._cached is not None:
+            return self._cached
+
         if not self.token_file.exists():
             self.logger.debug("No token file found")
             return None
@@ -92,6 +120,11 @@ class TokenStorage:
                 token_data = json.load(f)
 
             self.logger.debug("Loaded tokens from storage")
+            self._cached = token_data
+            expires_at = token_data.get("expires_at")
+            self._expires_monotonic = (
+                time.monotonic() + (expires_at - time.time()) if expires_at else None
+            )
             return token_data
         except (OSError, json.JSONDecodeError) as e:
             self.logger.error(f"Failed to load tokens: {e}")
@@ -103,15 +136,13 @@ class TokenStorage:
         Returns:
             Access token or None if expired/missing
         """
-        import time
-
         token_data = self.load_tokens()
         if not token_data:
             return None
 
         # Check if token is expired
-        expires_at = token_data.get("expires_at")
-        if expires_at and time.time() >= expires_at:
+        expires_at = self._expires_monotonic
+        if expires_at is not None and time.monotonic() >= expires_at - self.EXPIRY_MARGIN:
             self.logger.debug("Access token expired")
             return None
 
@@ -131,6 +162,8 @@ class TokenStorage:
 
     def clear_tokens(self):
         """Remove all stored tokens."""
+        self._cached = None
+        self._expires_monotonic = None
         if self.token_file.exists():
             try:
                 self.token_file.unlink()